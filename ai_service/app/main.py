@@ -13,6 +13,7 @@ from app.database import get_db_session
 from app.models import Post
 from app.post_processor import (
     process_single_post,
+    process_post,
     prepare_post_data,
     process_post_batch,
     process_posts_async
@@ -201,9 +202,10 @@ def process_posts_continuously(interval_seconds: int = 5):
             week_start, week_end = get_week_bounds()
             
             with get_db_session() as db:
-                # Find one post from this week without summary
+                # Find one post from this week without summary (author loaded in the same query)
                 post = (
                     db.query(Post)
+                    .options(joinedload(Post.author))
                     .filter(
                         Post.created_at >= week_start,
                         Post.created_at <= week_end,
@@ -215,7 +217,7 @@ def process_posts_continuously(interval_seconds: int = 5):
                 
                 if post:
                     logger.info(f"Found unprocessed post {post.id}, processing...")
-                    success = process_single_post(post.id)
+                    success = process_post(post, db)
                     if success:
                         logger.info(f"Successfully processed post {post.id}")
                     else:
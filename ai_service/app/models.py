@@ -5,6 +5,7 @@ Minimal models needed for this service.
 Matches the main backend schema.
 """
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Float
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
@@ -35,7 +36,7 @@ class Post(Base):
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
     audience_type = Column(String(20), default="all")
-    photo_urls = Column(JSON, default=lambda: [])
+    photo_urls = Column(JSON().with_variant(ARRAY(Text), "postgresql"), default=lambda: [], nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     digest_summary = Column(Text, nullable=True)
     importance_score = Column(Float, nullable=True)
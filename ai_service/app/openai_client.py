@@ -4,7 +4,11 @@ OpenAI client for generating digest summaries.
 Handles image processing and API calls to OpenAI.
 """
 import base64
+import json
 import logging
+import os
+import re
+import tempfile
 import requests
 from typing import Optional, Tuple
 from openai import OpenAI
@@ -16,6 +20,9 @@ logger = logging.getLogger(__name__)
 # Initialize OpenAI client
 client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
+# Fallback extractor for responses that wrap the JSON object in extra text
+_SUMMARY_JSON_RE = re.compile(r'\{[^{}]*"summary"[^{}]*"importance"[^{}]*\}', re.DOTALL)
+
 
 def download_and_encode_image(image_url: str, max_size_mb: int = None) -> Optional[str]:
     """
@@ -269,16 +276,13 @@ Respond only with valid JSON:
         logger.debug(f"OpenAI response: {response_text}")
         
         # Parse JSON response
-        import json
-        import re
-        
         try:
             # Try to parse as JSON directly
             result = json.loads(response_text)
         except json.JSONDecodeError:
             # If that fails, try to extract JSON from markdown code blocks or text
             logger.warning("Response is not valid JSON, attempting to extract...")
-            json_match = re.search(r'\{[^{}]*"summary"[^{}]*"importance"[^{}]*\}', response_text, re.DOTALL)
+            json_match = _SUMMARY_JSON_RE.search(response_text)
             if json_match:
                 try:
                     result = json.loads(json_match.group(0))
@@ -463,10 +467,6 @@ def create_batch_job(requests: list[dict]) -> str:
     Returns:
         Batch job ID
     """
-    import json
-    import tempfile
-    import os
-    
     try:
         # Create a temporary JSONL file
         with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
@@ -555,7 +555,6 @@ def retrieve_batch_results(batch_id: str) -> list[dict]:
         output_file = client.files.content(batch_status["output_file_id"])
         
         # Parse JSONL results
-        import json
         results = []
         
         # Handle both text and bytes responses
@@ -592,9 +591,6 @@ def parse_batch_result(result: dict) -> Tuple[str, float]:
     Returns:
         tuple: (summary: str, importance_score: float)
     """
-    import json
-    import re
-    
     try:
         # Extract the response body
         if "response" not in result:
@@ -631,7 +627,7 @@ def parse_batch_result(result: dict) -> Tuple[str, float]:
             result_json = json.loads(response_text)
         except json.JSONDecodeError:
             # Try to extract JSON from markdown or text
-            json_match = re.search(r'\{[^{}]*"summary"[^{}]*"importance"[^{}]*\}', response_text, re.DOTALL)
+            json_match = _SUMMARY_JSON_RE.search(response_text)
             if json_match:
                 result_json = json.loads(json_match.group(0))
             else:
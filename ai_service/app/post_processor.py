@@ -89,57 +89,76 @@ def process_single_post(post_id: int) -> bool:
                 logger.warning(f"Post {post_id} not found")
                 return False
             
-            # Check if already processed
-            if post.digest_summary is not None:
-                logger.info(f"Post {post_id} already has a digest summary, skipping")
-                return True
-            
-            # Prepare post data
-            post_data = prepare_post_data(post, db)
-            if not post_data:
-                return False
-            
-            # Generate summary
-            logger.info(f"Processing post {post_id} by {post_data['author_name']}")
-            try:
-                summary, importance = generate_digest_summary(
-                    post_content=post.content,
-                    author_name=post_data["author_name"],
-                    image_urls=post_data["photo_urls"],
-                    timestamp=post.created_at.isoformat() if post.created_at else None
-                )
-                
-                # Validate that we got valid results (not None or empty)
-                if not summary or not isinstance(summary, str) or len(summary.strip()) == 0:
-                    raise ValueError("Generated summary is empty or invalid")
-                if not isinstance(importance, (int, float)) or importance < 0 or importance > 10:
-                    raise ValueError(f"Generated importance score is invalid: {importance}")
-                
-                # Only update post if LLM call succeeded and we have valid results
-                post.digest_summary = summary
-                post.importance_score = importance
-                db.commit()
-                
-                logger.info(
-                    f"Successfully processed post {post_id}: "
-                    f"importance={importance:.1f}, summary_length={len(summary)}"
-                )
-                
-                return True
-            except Exception as e:
-                # LLM call failed - don't update the post, don't set any default values
-                logger.error(f"LLM call failed for post {post_id}: {str(e)}")
-                # Explicitly rollback to ensure no partial updates
-                db.rollback()
-                # Ensure post fields are not modified
-                db.refresh(post)
-                return False
+            return process_post(post, db)
     
     except Exception as e:
         logger.error(f"Error processing post {post_id}: {str(e)}", exc_info=True)
         return False
 
 
+def process_post(post: Post, db: Session) -> bool:
+    """
+    Generate the digest summary for an already-loaded post.
+    
+    The caller controls loading, so it should fetch the post with
+    joinedload(Post.author) to avoid a lazy author SELECT here.
+    
+    Args:
+        post: Post model instance bound to db
+        db: Database session
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    post_id = post.id
+    
+    # Check if already processed
+    if post.digest_summary is not None:
+        logger.info(f"Post {post_id} already has a digest summary, skipping")
+        return True
+    
+    # Prepare post data
+    post_data = prepare_post_data(post, db)
+    if not post_data:
+        return False
+    
+    # Generate summary
+    logger.info(f"Processing post {post_id} by {post_data['author_name']}")
+    try:
+        summary, importance = generate_digest_summary(
+            post_content=post.content,
+            author_name=post_data["author_name"],
+            image_urls=post_data["photo_urls"],
+            timestamp=post.created_at.isoformat() if post.created_at else None
+        )
+        
+        # Validate that we got valid results (not None or empty)
+        if not summary or not isinstance(summary, str) or len(summary.strip()) == 0:
+            raise ValueError("Generated summary is empty or invalid")
+        if not isinstance(importance, (int, float)) or importance < 0 or importance > 10:
+            raise ValueError(f"Generated importance score is invalid: {importance}")
+        
+        # Only update post if LLM call succeeded and we have valid results
+        post.digest_summary = summary
+        post.importance_score = importance
+        db.commit()
+        
+        logger.info(
+            f"Successfully processed post {post_id}: "
+            f"importance={importance:.1f}, summary_length={len(summary)}"
+        )
+        
+        return True
+    except Exception as e:
+        # LLM call failed - don't update the post, don't set any default values
+        logger.error(f"LLM call failed for post {post_id}: {str(e)}")
+        # Explicitly rollback to ensure no partial updates
+        db.rollback()
+        # Ensure post fields are not modified
+        db.refresh(post)
+        return False
+
+
 def wait_for_batch_completion(batch_id: str, poll_interval: int = 10, max_wait_time: int = 3600) -> bool:
     """
     Wait for a batch job to complete.
@@ -36,6 +36,8 @@ class Settings(BaseSettings):
     STORAGE_PRESIGNED_URL_EXPIRATION: int = 43200  # 12 hours in seconds
     STORAGE_IMAGE_CACHE_CONTROL: str = "private, max-age=31536000, immutable"
     STORAGE_REDIRECT_CACHE_MAX_AGE: int = 3600  # Cache 302 responses for 1 hour
+    STORAGE_VERIFY_IMAGE_INTEGRITY: bool = False  # Run PIL verify() (full scan) on uploads
+    STORAGE_FAST_PRESIGN: bool = False  # Sign GET URLs with the built-in SigV4 signer instead of botocore
     
     # R2 (Cloudflare) configuration - Destination for migration and future use
     R2_ACCESS_KEY_ID: Optional[str] = None  # R2 Access Key ID
@@ -69,6 +71,30 @@ class Settings(BaseSettings):
     # Moderator configuration
     MODERATOR_EMAILS: Optional[str] = None  # Comma-separated list of moderator emails
     
+    # Seconds an authenticated user row is reused across requests with the same token.
+    # 0 (default) disables it; cache hits still re-check is_banned/existence in the DB.
+    AUTH_USER_CACHE_TTL: int = 0
+    
+    # Threads shared by sync routes/dependencies and run_in_threadpool offloads
+    # (Google ID token verification, image validation, uploads). anyio's default is 40.
+    WORKER_THREADS: int = 40
+    
+    # Rate limiting configuration
+    # "memory://" keeps counters per worker process; point every worker at one
+    # store (e.g. "redis://host:6379/0", needs the redis package) so limits are global
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
+    RATE_LIMIT_STRATEGY: str = "moving-window"  # "fixed-window" or "moving-window"
+    RATE_LIMIT_ENABLED: bool = True
+    # Peers (IPs or CIDRs, comma-separated) whose X-Forwarded-For is trusted for the
+    # client address. Defaults cover nginx on the host reaching the container via
+    # loopback or the Docker bridge; without this every client shares one limit.
+    RATE_LIMIT_TRUSTED_PROXIES: str = "127.0.0.1,::1,172.16.0.0/12"
+    
+    # Observability configuration
+    ENABLE_METRICS: bool = True  # Expose Prometheus HTTP metrics at /metrics
+    METRICS_EXCLUDED_HANDLERS: str = ""  # Comma-separated route regexes to leave uninstrumented
+    LOG_SAMPLE_RATE: float = 0.0  # Fraction of fast, successful requests to log (slow/error/auth are always logged)
+    
     # Digest configuration
     DIGEST_POSTS_PER_CONNECTION_PER_DAY: int = 2  # Number of top posts per connection per day (1-2)
     DIGEST_MIN_IMPORTANCE_THRESHOLD: float = 1.0  # Posts with importance <= this are excluded (memes/low-quality)
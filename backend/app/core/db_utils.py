@@ -1,10 +1,8 @@
 """Database utilities for improved transaction management."""
-from contextlib import contextmanager
 from sqlalchemy.orm import Session
 
 
-@contextmanager
-def transaction(db: Session):
+class transaction:
     """
     Context manager for database transactions.
     Automatically commits on success, rolls back on error.
@@ -25,10 +23,26 @@ def transaction(db: Session):
             new_post.photo_urls = photo_s3_keys
             
             # Transaction commits here automatically
+
+    Implemented as a plain class rather than ``@contextmanager`` so entering
+    it does not allocate a generator. ``db.begin()`` is not used because the
+    session has usually autobegun a transaction by the time this is entered.
     """
-    try:
-        yield db
-        db.commit()
-    except Exception:
-        db.rollback()
-        raise
+    __slots__ = ("db",)
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def __enter__(self) -> Session:
+        return self.db
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None:
+            self.db.rollback()
+            return False
+        try:
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return False
@@ -1,8 +1,13 @@
-from typing import Generator, Annotated
+import hashlib
+import threading
+import time
+from itertools import chain
+from typing import Generator, Annotated, Dict, Set, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
-from sqlalchemy.orm import Session
+from jwt import PyJWTError
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.db import SessionLocal
 from app.config import settings
@@ -18,6 +23,68 @@ def get_db() -> Generator:
     finally:
         db.close()
 
+# Authenticated user cache: sha256(token) -> (column values, valid_until).
+# Off by default (AUTH_USER_CACHE_TTL=0). A hit skips the JWT decode and the
+# full user load, but still re-reads is_banned by primary key, so bans and
+# deletions made by other processes (the moderation service) apply on the
+# next request. Each request gets its own instance attached to its own
+# session; local writes to a User evict it immediately.
+_USER_CACHE: Dict[bytes, Tuple[dict, float]] = {}
+_USER_CACHE_KEYS: Dict[int, Set[bytes]] = {}  # user id -> its cache keys, for eviction
+_USER_CACHE_MAX_SIZE = 10_000
+_USER_CACHE_TTL = settings.AUTH_USER_CACHE_TTL
+_user_cache_lock = threading.Lock()
+_USER_COLUMNS = tuple(column.key for column in User.__table__.columns)
+
+
+def _drop_cache_key(key: bytes) -> None:
+    """Remove one entry and its id index slot; caller holds the lock."""
+    row, _ = _USER_CACHE.pop(key)
+    keys = _USER_CACHE_KEYS.get(row["id"])
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del _USER_CACHE_KEYS[row["id"]]
+
+
+def _evict_cached_user(user_id: int) -> None:
+    with _user_cache_lock:
+        for key in _USER_CACHE_KEYS.pop(user_id, ()):
+            _USER_CACHE.pop(key, None)
+
+
+@event.listens_for(Session, "before_flush")
+def _evict_modified_users(session, flush_context, instances):
+    if not _USER_CACHE:
+        return
+    for obj in chain(session.dirty, session.deleted):
+        if isinstance(obj, User):
+            _evict_cached_user(obj.id)
+
+
+def _cache_user(cache_key: bytes, user: User, lifetime: float) -> None:
+    row = {name: getattr(user, name) for name in _USER_COLUMNS}
+    now = time.monotonic()
+    with _user_cache_lock:
+        if cache_key in _USER_CACHE:
+            _drop_cache_key(cache_key)
+        if len(_USER_CACHE) >= _USER_CACHE_MAX_SIZE:
+            for key in [k for k, (_, until) in _USER_CACHE.items() if until <= now]:
+                _drop_cache_key(key)
+            if len(_USER_CACHE) >= _USER_CACHE_MAX_SIZE:
+                _drop_cache_key(next(iter(_USER_CACHE)))
+        _USER_CACHE[cache_key] = (row, now + lifetime)
+        _USER_CACHE_KEYS.setdefault(row["id"], set()).add(cache_key)
+
+
+def _attach_cached_user(db: Session, row: dict) -> User:
+    """Rebuild a User from cached column values as a persistent instance of ``db``."""
+    user = User(**row)
+    make_transient_to_detached(user)
+    db.add(user)
+    return user
+
+
 def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Session = Depends(get_db)
@@ -27,17 +94,22 @@ def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = decode_access_token(token)
-        user_id: str = payload.get("sub")
-        if user_id is None:
+    cache_key = hashlib.sha256(token.encode()).digest()
+    cached = _USER_CACHE.get(cache_key)
+    if cached is not None and cached[1] > time.monotonic():
+        # Cheap primary-key probe: the user may since have been banned or
+        # deleted by another process
+        is_banned = db.query(User.is_banned).filter(User.id == cached[0]["id"]).scalar()
+        if is_banned is None:
+            _evict_cached_user(cached[0]["id"])
             raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    if user is None:
-        raise credentials_exception
+        user = _attach_cached_user(db, {**cached[0], "is_banned": is_banned})
+    else:
+        user, expires_at = _load_user_from_token(token, db, credentials_exception)
+        # Never serve a cached user past the token's own expiry
+        lifetime = min(_USER_CACHE_TTL, expires_at - time.time())
+        if lifetime > 0:
+            _cache_user(cache_key, user, lifetime)
     
     # Check if user is banned
     if user.is_banned:
@@ -48,3 +120,21 @@ def get_current_user(
         )
     
     return user
+
+
+def _load_user_from_token(
+    token: str, db: Session, credentials_exception: HTTPException
+) -> Tuple[User, float]:
+    """Decode the token and load its user; returns (user, token exp timestamp)."""
+    try:
+        payload = decode_access_token(token)
+        user_id: str = payload.get("sub")
+        if user_id is None:
+            raise credentials_exception
+    except PyJWTError:
+        raise credentials_exception
+    
+    user = db.query(User).filter(User.id == int(user_id)).first()
+    if user is None:
+        raise credentials_exception
+    return user, float(payload.get("exp", 0))
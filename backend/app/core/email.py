@@ -1,6 +1,7 @@
 import smtplib
-import random
+import secrets
 import logging
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
@@ -8,19 +9,27 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Callers should dispatch this after commit (e.g. FastAPI BackgroundTasks) so a
+# slow mail server never holds a request open; bound each attempt and retry
+# transient failures a few times with backoff.
+_SMTP_TIMEOUT = 10  # seconds per connection/command
+_SMTP_ATTEMPTS = 3
+_SMTP_BACKOFF = 1.0  # seconds, doubled after each failed attempt
 
-def generate_otp() -> str:
-    """Generate a secure 6-digit OTP."""
-    return str(random.randint(100000, 999999))
 
+def generate_otp() -> int:
+    """Generate a secure 6-digit OTP (stored as an integer, zero-padded for display)."""
+    return secrets.randbelow(1_000_000)
 
-def send_otp_email(email: str, otp_code: str) -> bool:
+
+def send_otp_email(email: str, otp_code: int) -> bool:
     """
     Send OTP verification email via SMTP.
     Returns True if sent successfully, False otherwise.
     
     In development mode (when SMTP not configured), logs OTP to console.
     """
+    otp_code = f"{otp_code:06d}"
     smtp_username = getattr(settings, 'SMTP_USERNAME', None)
     smtp_password = getattr(settings, 'SMTP_PASSWORD', None)
     
@@ -69,15 +78,23 @@ Intentional Social
         msg.attach(MIMEText(body, 'plain'))
         
         # Send email
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()
-        server.login(smtp_username, smtp_password)
-        server.send_message(msg)
-        server.quit()
+        for attempt in range(1, _SMTP_ATTEMPTS + 1):
+            try:
+                with smtplib.SMTP(smtp_server, smtp_port, timeout=_SMTP_TIMEOUT) as server:
+                    server.starttls()
+                    server.login(smtp_username, smtp_password)
+                    server.send_message(msg)
+                break
+            except smtplib.SMTPAuthenticationError:
+                raise  # Misconfiguration; retrying won't help
+            except (smtplib.SMTPException, OSError) as e:
+                if attempt == _SMTP_ATTEMPTS:
+                    raise
+                logger.warning(f"OTP email to {email} failed (attempt {attempt}/{_SMTP_ATTEMPTS}): {e}")
+                time.sleep(_SMTP_BACKOFF * 2 ** (attempt - 1))
         
         logger.info(f"OTP email sent successfully to {email}")
         return True
     except Exception as e:
         logger.error(f"Failed to send OTP email to {email}: {e}")
         return False
-
@@ -1,19 +1,34 @@
 from app.config import settings
 
-
-def is_storage_key(value: str) -> bool:
-    """Check if a value looks like a storage object key."""
-    if not value:
-        return False
-    prefixes = [
+# Resolved once at import; str.startswith(tuple) iterates the prefixes in C
+STORAGE_PREFIXES = tuple(
+    prefix
+    for prefix in (
         settings.STORAGE_PHOTO_PREFIX,
         settings.STORAGE_AVATAR_PREFIX,
         settings.S3_PHOTO_PREFIX,
         settings.S3_AVATAR_PREFIX,
-    ]
-    return any(value.startswith(prefix) for prefix in prefixes if prefix)
+    )
+    if prefix
+)
+
+
+def is_storage_key(value: str) -> bool:
+    """Check if a value looks like a storage object key."""
+    return bool(value) and value.startswith(STORAGE_PREFIXES)
+
+
+IMAGE_PATH_PREFIX = "/images/"
 
 
 def build_image_path(s3_key: str) -> str:
     """Build the stable image path for a storage key."""
-    return f"/images/{s3_key}"
+    return IMAGE_PATH_PREFIX + s3_key
+
+
+def build_image_paths(s3_keys: list[str] | None) -> list[str]:
+    """Build stable image paths for a list of storage keys in one pass."""
+    if not s3_keys:
+        return []
+    prefix = IMAGE_PATH_PREFIX
+    return [prefix + key for key in s3_keys]
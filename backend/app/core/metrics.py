@@ -1,5 +1,24 @@
 """Custom Prometheus metrics for monitoring application performance."""
-from prometheus_client import Counter, Histogram, Gauge
+import os
+
+from prometheus_client import Counter, Histogram
+from prometheus_fastapi_instrumentator import Instrumentator, metrics
+
+from app.config import settings
+
+# Multi-worker deployments set PROMETHEUS_MULTIPROC_DIR: every worker then
+# writes its samples there and /metrics serves the aggregate across workers
+# (the in-progress gauge is summed over live processes only). The directory
+# must exist before the first metric below is created.
+_MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+if _MULTIPROC_DIR:
+    os.makedirs(_MULTIPROC_DIR, exist_ok=True)
+
+# Only metrics with live call sites are declared here; unused series are
+# dropped so every scrape stays small.
+
+# Shared bucket schedule for endpoint latency histograms
+HTTP_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
 
 # Request counters
 feed_requests_total = Counter(
@@ -12,69 +31,56 @@ digest_requests_total = Counter(
     'Total number of digest requests'
 )
 
-post_creations_total = Counter(
-    'post_creations_total',
-    'Total number of posts created'
-)
-
-post_deletions_total = Counter(
-    'post_deletions_total',
-    'Total number of posts deleted'
-)
-
-connection_requests_total = Counter(
-    'connection_requests_total',
-    'Total number of connection requests sent'
-)
-
-connection_accepts_total = Counter(
-    'connection_accepts_total',
-    'Total number of connection requests accepted'
-)
-
 # Latency histograms
 feed_latency_seconds = Histogram(
     'feed_latency_seconds',
     'Feed endpoint latency in seconds',
-    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0]
+    buckets=HTTP_BUCKETS
 )
 
 digest_latency_seconds = Histogram(
     'digest_latency_seconds',
     'Digest endpoint latency in seconds',
-    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0]
+    buckets=HTTP_BUCKETS
 )
 
-post_creation_latency_seconds = Histogram(
-    'post_creation_latency_seconds',
-    'Post creation latency in seconds',
-    buckets=[0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0]
-)
 
-db_query_latency_seconds = Histogram(
-    'db_query_latency_seconds',
-    'Database query latency in seconds',
-    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5]
-)
+# Pre-bound hot-path callables (skip the attribute lookup chain per request)
+inc_feed_request = feed_requests_total.inc
+observe_feed_latency = feed_latency_seconds.observe
+inc_digest_request = digest_requests_total.inc
+observe_digest_latency = digest_latency_seconds.observe
 
-s3_operation_latency_seconds = Histogram(
-    's3_operation_latency_seconds',
-    'S3 operation latency in seconds',
-    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0]
-)
 
-# Gauges
-active_connections_gauge = Gauge(
-    'active_connections_total',
-    'Total number of active connections in the system'
-)
+# Probe and scrape endpoints are hit far more often than real traffic and
+# would dominate instrumentation cost; patterns are anchored regexes matched
+# against the route template. METRICS_EXCLUDED_HANDLERS appends to the list.
+EXCLUDED_HANDLERS = ["^/health$", "^/metrics$", "^/openapi.json$"] + [
+    pattern.strip()
+    for pattern in settings.METRICS_EXCLUDED_HANDLERS.split(",")
+    if pattern.strip()
+]
 
-posts_total_gauge = Gauge(
-    'posts_total',
-    'Total number of posts in the system'
-)
+# Coarse latency schedule for the per-handler request histogram
+REQUEST_LATENCY_BUCKETS = (0.05, 0.1, 0.3, 1, 3, 5)
 
-users_total_gauge = Gauge(
-    'users_total',
-    'Total number of users in the system'
-)
+
+def setup_instrumentation(app) -> None:
+    """Instrument HTTP requests and expose them at /metrics (if ENABLE_METRICS)."""
+    if not settings.ENABLE_METRICS:
+        return
+    
+    instrumentator = Instrumentator(
+        excluded_handlers=EXCLUDED_HANDLERS,
+        # The handler label is the route template (e.g. /images/{s3_key:path}),
+        # never the raw URL; requests matching no route share one "none" label
+        # so scanners and 404 floods can't mint new series.
+        should_group_untemplated=True,
+        should_ignore_untemplated=False,
+        should_group_status_codes=False,
+        should_instrument_requests_inprogress=True,
+        inprogress_name="http_requests_inprogress",
+        inprogress_labels=True,
+    )
+    instrumentator.add(metrics.default(latency_highr_buckets=REQUEST_LATENCY_BUCKETS))
+    instrumentator.instrument(app).expose(app, include_in_schema=False)
@@ -1,15 +1,94 @@
 import secrets
 import hashlib
 import base64
+import json
+import threading
+import time
 import httpx
 from typing import Optional, Dict, Tuple
 from fastapi import HTTPException, status
+from google.auth import exceptions as google_exceptions
+from google.auth import jwt as google_jwt
 from google.auth.transport import requests
-from google.oauth2 import id_token
 
 from app.config import settings
 
 
+_GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+_GOOGLE_CERTS_DEFAULT_TTL = 3600
+
+# One pooled session/client per process so cert fetches and token exchanges
+# reuse keep-alive connections instead of a fresh TCP+TLS handshake each time
+_google_request = requests.Request()
+_google_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_google_client() -> httpx.AsyncClient:
+    """Return the shared client, (re)creating it if missing or closed by a previous shutdown."""
+    global _google_client
+    if _google_client is None or _google_client.is_closed:
+        _google_client = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=50, keepalive_expiry=60.0),
+        )
+    return _google_client
+
+# Google signing certs: (certs, valid_until). Refreshed per the endpoint's
+# Cache-Control max-age, or early when a token names an unknown key id.
+_google_certs: Optional[Tuple[Dict[str, str], float]] = None
+_google_certs_lock = threading.Lock()
+
+
+def _cache_max_age(cache_control: Optional[str]) -> int:
+    """Extract max-age from a Cache-Control header, falling back to a default."""
+    for directive in (cache_control or "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "max-age" and value.isdigit():
+            return int(value)
+    return _GOOGLE_CERTS_DEFAULT_TTL
+
+
+def _token_key_id(id_token_str: str) -> Optional[str]:
+    """Read the unverified ``kid`` from a JWT header (used only to pick a cert)."""
+    try:
+        header = id_token_str.split(".", 1)[0]
+        return json.loads(base64.urlsafe_b64decode(header + "=" * (-len(header) % 4))).get("kid")
+    except ValueError:
+        return None
+
+
+def _get_google_certs(key_id: Optional[str] = None) -> Dict[str, str]:
+    """Return Google's signing certs, fetching only when stale or missing key_id."""
+    global _google_certs
+    cached = _google_certs
+    if cached is not None and cached[1] > time.monotonic() and (key_id is None or key_id in cached[0]):
+        return cached[0]
+
+    with _google_certs_lock:
+        # Another thread may have refreshed while we waited
+        cached = _google_certs
+        if cached is not None and cached[1] > time.monotonic() and (key_id is None or key_id in cached[0]):
+            return cached[0]
+
+        response = _google_request(_GOOGLE_CERTS_URL, method="GET")
+        if response.status != 200:
+            raise google_exceptions.TransportError(
+                f"Could not fetch certificates at {_GOOGLE_CERTS_URL}"
+            )
+        certs = json.loads(response.data.decode("utf-8"))
+        max_age = _cache_max_age(response.headers.get("cache-control"))
+        _google_certs = (certs, time.monotonic() + max_age)
+        return certs
+
+
+async def close_google_client() -> None:
+    """Close the shared Google HTTP client (called on app shutdown)."""
+    global _google_client
+    if _google_client is not None:
+        await _google_client.aclose()
+        _google_client = None
+
+
 def generate_pkce_pair() -> Tuple[str, str]:
     """
     Generate PKCE code verifier and code challenge.
@@ -84,24 +163,23 @@ async def exchange_code_for_tokens(
         "code_verifier": code_verifier,
     }
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(token_url, data=data)
-            response.raise_for_status()
-            tokens = response.json()
-            
-            if "error" in tokens:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Token exchange failed: {tokens.get('error_description', tokens['error'])}"
-                )
-            
-            return tokens
-        except httpx.HTTPStatusError as e:
+    try:
+        response = await _get_google_client().post(token_url, data=data)
+        response.raise_for_status()
+        tokens = response.json()
+        
+        if "error" in tokens:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Failed to exchange code for tokens: {e.response.text}"
+                detail=f"Token exchange failed: {tokens.get('error_description', tokens['error'])}"
             )
+        
+        return tokens
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to exchange code for tokens: {e.response.text}"
+        )
 
 
 def verify_google_id_token(id_token_str: str) -> Dict:
@@ -118,11 +196,11 @@ def verify_google_id_token(id_token_str: str) -> Dict:
         HTTPException if token is invalid
     """
     try:
-        # Verify the token signature and claims
-        idinfo = id_token.verify_oauth2_token(
+        # Verify the token signature and claims against the cached cert set
+        idinfo = google_jwt.decode(
             id_token_str,
-            requests.Request(),
-            settings.GOOGLE_CLIENT_ID
+            certs=_get_google_certs(_token_key_id(id_token_str)),
+            audience=settings.GOOGLE_CLIENT_ID,
         )
         
         # Verify the token issuer
@@ -163,13 +241,43 @@ async def get_google_user_info(access_token: str) -> Dict:
     
     headers = {"Authorization": f"Bearer {access_token}"}
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(userinfo_url, headers=headers)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Failed to fetch user info: {e.response.text}"
-            )
+    try:
+        response = await _get_google_client().get(userinfo_url, headers=headers)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to fetch user info: {e.response.text}"
+        )
+
+
+# Verified ID token cache: sha256(token) -> (payload, valid_until).
+# A retried callback with the same token skips the cert fetch and RSA verify;
+# entries never outlive the token's own exp claim.
+_ID_TOKEN_CACHE: Dict[str, Tuple[Dict, float]] = {}
+_ID_TOKEN_CACHE_MAX_SIZE = 10_000
+_ID_TOKEN_CACHE_TTL = 60
+_id_token_cache_lock = threading.Lock()
+
+
+def verify_google_id_token_cached(id_token_str: str) -> Dict:
+    """Same as verify_google_id_token, reusing recent results for an identical token."""
+    cache_key = hashlib.sha256(id_token_str.encode('utf-8')).hexdigest()
+    now = time.monotonic()
+    cached = _ID_TOKEN_CACHE.get(cache_key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    idinfo = verify_google_id_token(id_token_str)
+
+    lifetime = min(float(idinfo.get('exp', 0)) - time.time(), _ID_TOKEN_CACHE_TTL)
+    if lifetime > 0:
+        with _id_token_cache_lock:
+            if len(_ID_TOKEN_CACHE) >= _ID_TOKEN_CACHE_MAX_SIZE:
+                for key in [k for k, (_, until) in _ID_TOKEN_CACHE.items() if until <= now]:
+                    del _ID_TOKEN_CACHE[key]
+                if len(_ID_TOKEN_CACHE) >= _ID_TOKEN_CACHE_MAX_SIZE:
+                    del _ID_TOKEN_CACHE[next(iter(_ID_TOKEN_CACHE))]
+            _ID_TOKEN_CACHE[cache_key] = (idinfo, now + lifetime)
+    return idinfo
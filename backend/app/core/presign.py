@@ -0,0 +1,92 @@
+"""Minimal SigV4 query-string presigner for GET requests against one bucket.
+
+botocore's generic presign path builds a full request model and runs its
+auth pipeline for every URL. For feed images we only ever presign
+``get_object`` on a single bucket, so the canonical request can be built
+directly and the derived signing key reused for the whole UTC day.
+Output is byte-identical to botocore's path-style presigned URLs.
+"""
+import hashlib
+import hmac
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import quote, urlsplit
+
+_ALGORITHM = "AWS4-HMAC-SHA256"
+_SERVICE = "s3"
+_UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+
+# (secret_key, date_stamp, region) -> derived signing key
+_signing_key_cache: dict[tuple[str, str, str], bytes] = {}
+
+
+def _uri_encode(value: str, safe: str = "-_.~") -> str:
+    return quote(value, safe=safe)
+
+
+def _signing_key(secret_key: str, date_stamp: str, region: str) -> bytes:
+    """Derive (and memoize per day) the SigV4 signing key."""
+    cache_key = (secret_key, date_stamp, region)
+    key = _signing_key_cache.get(cache_key)
+    if key is None:
+        k_date = hmac.new(("AWS4" + secret_key).encode(), date_stamp.encode(), hashlib.sha256).digest()
+        k_region = hmac.new(k_date, region.encode(), hashlib.sha256).digest()
+        k_service = hmac.new(k_region, _SERVICE.encode(), hashlib.sha256).digest()
+        key = hmac.new(k_service, b"aws4_request", hashlib.sha256).digest()
+        # Only today's key is useful; drop older days
+        _signing_key_cache.clear()
+        _signing_key_cache[cache_key] = key
+    return key
+
+
+def presign_get_url(
+    endpoint_url: str,
+    bucket: str,
+    key: str,
+    access_key: str,
+    secret_key: str,
+    region: str,
+    expires_in: int,
+    response_cache_control: Optional[str] = None,
+    now: Optional[datetime] = None,
+) -> str:
+    """Build a path-style presigned GET URL for ``bucket/key``."""
+    if now is None:
+        now = datetime.now(timezone.utc)
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    date_stamp = amz_date[:8]
+    scope = f"{date_stamp}/{region}/{_SERVICE}/aws4_request"
+
+    parts = urlsplit(endpoint_url)
+    host = parts.netloc
+    base_path = parts.path.rstrip("/")
+    canonical_uri = _uri_encode(f"{base_path}/{bucket}/{key}", safe="/-_.~")
+
+    # Same parameter order as botocore: request params first, then auth params
+    params = {}
+    if response_cache_control:
+        params["response-cache-control"] = response_cache_control
+    params["X-Amz-Algorithm"] = _ALGORITHM
+    params["X-Amz-Credential"] = f"{access_key}/{scope}"
+    params["X-Amz-Date"] = amz_date
+    params["X-Amz-Expires"] = str(expires_in)
+    params["X-Amz-SignedHeaders"] = "host"
+    encoded = [(_uri_encode(k), _uri_encode(v)) for k, v in params.items()]
+    query = "&".join(f"{k}={v}" for k, v in encoded)
+    canonical_query = "&".join(f"{k}={v}" for k, v in sorted(encoded))
+
+    canonical_request = (
+        f"GET\n{canonical_uri}\n{canonical_query}\n"
+        f"host:{host}\n\nhost\n{_UNSIGNED_PAYLOAD}"
+    )
+    string_to_sign = (
+        f"{_ALGORITHM}\n{amz_date}\n{scope}\n"
+        f"{hashlib.sha256(canonical_request.encode()).hexdigest()}"
+    )
+    signature = hmac.new(
+        _signing_key(secret_key, date_stamp, region),
+        string_to_sign.encode(),
+        hashlib.sha256,
+    ).hexdigest()
+
+    return f"{parts.scheme}://{host}{canonical_uri}?{query}&X-Amz-Signature={signature}"
@@ -0,0 +1,56 @@
+import ipaddress
+
+from fastapi import Request
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from app.config import settings
+
+_TRUSTED_PROXIES = tuple(
+    ipaddress.ip_network(proxy.strip(), strict=False)
+    for proxy in settings.RATE_LIMIT_TRUSTED_PROXIES.split(",")
+    if proxy.strip()
+)
+
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _TRUSTED_PROXIES)
+
+
+def get_client_address(request: Request) -> str:
+    """Rate-limit key: the client IP, seen through trusted reverse proxies.
+
+    X-Forwarded-For is only read when the direct peer is a trusted proxy, and
+    is walked right to left so a client cannot spoof its key by prepending
+    addresses of its own.
+    """
+    address = get_remote_address(request)
+    if not _is_trusted_proxy(address):
+        return address
+    forwarded = request.headers.get("x-forwarded-for", "")
+    for hop in reversed([hop.strip() for hop in forwarded.split(",") if hop.strip()]):
+        address = hop
+        if not _is_trusted_proxy(hop):
+            break
+    return address
+
+
+# Created at import so route decorators bind their limits immediately
+limiter = Limiter(
+    key_func=get_client_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    strategy=settings.RATE_LIMIT_STRATEGY,
+    enabled=settings.RATE_LIMIT_ENABLED,
+)
+
+
+def rate_limit(limit_str: str):
+    """Apply a rate limit (e.g. "10/minute") to a route handler.
+
+    The handler must accept a ``request: Request`` argument.
+    """
+    return limiter.limit(limit_str)
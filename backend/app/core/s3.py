@@ -1,21 +1,101 @@
 import logging
+import os
+import threading
+import time
 import uuid
-from datetime import datetime, timedelta
 from io import BytesIO
-from typing import List, Optional, Tuple, Dict
+from typing import BinaryIO, List, Optional, Tuple, Dict, Union
 
-import boto3
-from botocore.exceptions import ClientError
-from botocore.config import Config
-from PIL import Image
+# boto3/botocore and Pillow are imported inside the functions that use them so
+# workers that never touch storage don't pay their import time and memory
 
 from app.config import settings
+from app.core.presign import presign_get_url
 
 logger = logging.getLogger(__name__)
 
+# Storage layout, resolved once at import; settings are immutable at runtime
+_BUCKET = settings.R2_BUCKET_NAME or settings.S3_BUCKET_NAME
+_ENDPOINT_URL = settings.R2_ENDPOINT_URL
+# R2 configuration, with fallback to legacy AWS_* variables for backward compatibility
+_ACCESS_KEY = settings.R2_ACCESS_KEY_ID or settings.AWS_ACCESS_KEY_ID
+_SECRET_KEY = settings.R2_SECRET_ACCESS_KEY or settings.AWS_SECRET_ACCESS_KEY
+_PRESIGNED_TTL = settings.STORAGE_PRESIGNED_URL_EXPIRATION or settings.S3_PRESIGNED_URL_EXPIRATION
+_PHOTO_PREFIX = settings.STORAGE_PHOTO_PREFIX or settings.S3_PHOTO_PREFIX
+_AVATAR_PREFIX = settings.STORAGE_AVATAR_PREFIX or settings.S3_AVATAR_PREFIX
+
+_CONTENT_TYPE = {
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'webp': 'image/webp'
+}
+_CONTENT_TYPE_GET = _CONTENT_TYPE.get
+
 # Initialize S3 client
 s3_client = None
 
+# Shared upload tuning, built on first upload
+transfer_config = None
+
+
+def get_transfer_config():
+    """Shared upload tuning: payloads above 8MB are split into parts and sent
+    in parallel; smaller images go out as a single PUT."""
+    global transfer_config
+    if transfer_config is None:
+        from boto3.s3.transfer import TransferConfig
+        
+        transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=4,
+            use_threads=True,
+        )
+    return transfer_config
+
+# Presigned URL cache: (s3_key, expiration, response_cache_control) -> (url, reuse_until).
+# A signed URL is reused until 80% of its lifetime has elapsed, so callers always
+# get a URL with at least 20% of its validity left.
+_PRESIGNED_CACHE: Dict[tuple, Tuple[str, float]] = {}
+_PRESIGNED_CACHE_MAX_SIZE = 50_000
+_PRESIGNED_CACHE_REUSE_FRACTION = 0.8
+_presigned_cache_lock = threading.Lock()
+
+
+def _cache_presigned_url(cache_key: tuple, url: str, reuse_until: float) -> None:
+    """Store a presigned URL, evicting expired (then oldest) entries when full."""
+    with _presigned_cache_lock:
+        if len(_PRESIGNED_CACHE) >= _PRESIGNED_CACHE_MAX_SIZE:
+            now = time.monotonic()
+            for key in [k for k, (_, until) in _PRESIGNED_CACHE.items() if until <= now]:
+                del _PRESIGNED_CACHE[key]
+            if len(_PRESIGNED_CACHE) >= _PRESIGNED_CACHE_MAX_SIZE:
+                del _PRESIGNED_CACHE[next(iter(_PRESIGNED_CACHE))]
+        _PRESIGNED_CACHE[cache_key] = (url, reuse_until)
+
+
+def _utc_timestamp() -> str:
+    """Second-resolution UTC ISO-8601 timestamp for object metadata."""
+    t = time.gmtime()
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
+    )
+
+
+def _uuid7() -> uuid.UUID:
+    """RFC 9562 UUIDv7: 48-bit unix ms timestamp, version/variant bits, random tail.
+
+    Keys generated close together sort (and list) together, and the embedded
+    timestamp makes a separate date segment in the key unnecessary.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Version 7 in bits 76-79, RFC 4122 variant (0b10) in bits 62-63
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
 
 def get_s3_client():
     """Lazy initialization of S3-compatible client (R2).
@@ -25,25 +105,22 @@ def get_s3_client():
     """
     global s3_client
     if s3_client is None:
-        # Use R2 configuration (with fallback to legacy AWS_* variables for backward compatibility)
-        access_key = settings.R2_ACCESS_KEY_ID or settings.AWS_ACCESS_KEY_ID
-        secret_key = settings.R2_SECRET_ACCESS_KEY or settings.AWS_SECRET_ACCESS_KEY
-        bucket_name = settings.R2_BUCKET_NAME or settings.S3_BUCKET_NAME
-        endpoint_url = settings.R2_ENDPOINT_URL
+        import boto3
+        from botocore.config import Config
         
-        if not access_key or not secret_key:
+        if not _ACCESS_KEY or not _SECRET_KEY:
             raise ValueError(
                 "Storage credentials not configured. "
                 "Set R2_ACCESS_KEY_ID and R2_SECRET_ACCESS_KEY environment variables."
             )
         
-        if not bucket_name:
+        if not _BUCKET:
             raise ValueError(
                 "Storage bucket name not configured. "
                 "Set R2_BUCKET_NAME environment variable."
             )
         
-        if not endpoint_url:
+        if not _ENDPOINT_URL:
             raise ValueError(
                 "R2 endpoint URL not configured. "
                 "Set R2_ENDPOINT_URL environment variable."
@@ -52,57 +129,111 @@ def get_s3_client():
         # Configure for R2 (S3-compatible API)
         # R2 uses s3v4 signatures and requires the endpoint URL
         # For R2, we must use "auto" as the region (R2 doesn't accept AWS region names)
+        # One client is shared by every request thread: size its connection pool
+        # above the threadpool's concurrency so uploads don't queue for a socket,
+        # keep idle TLS connections alive, and back off client-side on 503 SlowDown.
         s3_config = Config(
             signature_version='s3v4',
+            max_pool_connections=64,
+            tcp_keepalive=True,
+            retries={'max_attempts': 3, 'mode': 'adaptive'},
+            connect_timeout=3,
+            read_timeout=10,
         )
         
         s3_client = boto3.client(
             's3',
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            endpoint_url=endpoint_url,
+            aws_access_key_id=_ACCESS_KEY,
+            aws_secret_access_key=_SECRET_KEY,
+            endpoint_url=_ENDPOINT_URL,
             region_name='auto',  # Required for R2 - must be 'auto', not AWS regions
             config=s3_config
         )
-        logger.info(f"Initialized R2 client for bucket '{bucket_name}' at endpoint '{endpoint_url}'")
+        logger.info(f"Initialized R2 client for bucket '{_BUCKET}' at endpoint '{_ENDPOINT_URL}'")
     return s3_client
 
 
-def validate_image(file_content: bytes, max_size_mb: float = 0.2) -> Tuple[bool, Optional[str], Optional[Dict]]:
+# Magic-byte signatures for the allowed upload formats
+_JPEG_MAGIC = b"\xff\xd8\xff"
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+ALLOWED_IMAGE_FORMATS = ('JPEG', 'PNG', 'WEBP')
+# File extension to store each allowed format under
+IMAGE_FORMAT_EXTENSIONS = {'JPEG': 'jpg', 'PNG': 'png', 'WEBP': 'webp'}
+
+
+def _sniff_image_format(header: bytes) -> Optional[str]:
+    """Identify JPEG/PNG/WebP from the first 12 bytes, or None if unrecognised."""
+    if header[:3] == _JPEG_MAGIC:
+        return 'JPEG'
+    if header[:8] == _PNG_MAGIC:
+        return 'PNG'
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return 'WEBP'
+    return None
+
+
+def _as_fileobj(file_content: Union[bytes, BinaryIO]) -> BinaryIO:
+    """Wrap raw bytes in a BytesIO, or rewind an existing file object."""
+    if isinstance(file_content, (bytes, bytearray)):
+        return BytesIO(file_content)
+    file_content.seek(0)
+    return file_content
+
+
+def validate_image(file_content: Union[bytes, BinaryIO], max_size_mb: float = 0.2) -> Tuple[bool, Optional[str], Optional[Dict]]:
     """
     Validate image file for security and quality.
     
+    Only the image header is parsed (format and dimensions); the raster is
+    never decoded. Set STORAGE_VERIFY_IMAGE_INTEGRITY to also run PIL's
+    verify() scan.
+    
     Args:
-        file_content: Raw image bytes
+        file_content: Raw image bytes, or a seekable file object (e.g.
+            UploadFile.file) which is read in place and rewound afterwards
         max_size_mb: Maximum file size in MB (default 0.2MB = 200KB)
     
     Returns:
         Tuple of (is_valid, error_message, image_info)
         image_info contains: width, height, format, size_bytes
     """
+    from PIL import Image
+    
+    fileobj = _as_fileobj(file_content)
     try:
         # Check file size
-        size_bytes = len(file_content)
+        size_bytes = fileobj.seek(0, 2)
+        fileobj.seek(0)
         max_size_bytes = max_size_mb * 1024 * 1024
         
         if size_bytes > max_size_bytes:
             return False, f"Image size ({size_bytes / 1024:.1f}KB) exceeds maximum allowed size ({max_size_mb * 1024:.0f}KB)", None
         
+        # Reject anything that isn't JPEG/PNG/WebP by its magic bytes, without touching PIL
+        header = fileobj.read(12)
+        fileobj.seek(0)
+        sniffed_format = _sniff_image_format(header)
+        if sniffed_format is None:
+            return False, f"Image format not allowed. Allowed formats: {', '.join(ALLOWED_IMAGE_FORMATS)}", None
+        
         # Validate image format and get dimensions
         try:
-            image = Image.open(BytesIO(file_content))
-            width, height = image.size
-            
-            # Check format (only allow JPEG, PNG, WebP)
-            allowed_formats = ['JPEG', 'PNG', 'WEBP']
-            if image.format not in allowed_formats:
-                return False, f"Image format {image.format} not allowed. Allowed formats: {', '.join(allowed_formats)}", None
-            
-            # Verify it's actually an image (PIL will raise exception if not)
-            image.verify()
-            
-            # Reopen for metadata (verify() closes the image)
-            image = Image.open(BytesIO(file_content))
+            # Image.open only parses the header; pixel data is loaded lazily.
+            # It reads the caller's file object in place (no copy), and the
+            # context manager releases the parser state as soon as we're done.
+            # Restricting it to the sniffed format skips PIL's walk over every
+            # registered plugin.
+            with Image.open(fileobj, formats=(sniffed_format,)) as image:
+                width, height = image.size
+                image_format = image.format
+                
+                # Check format (only allow JPEG, PNG, WebP)
+                if image_format not in ALLOWED_IMAGE_FORMATS:
+                    return False, f"Image format {image_format} not allowed. Allowed formats: {', '.join(ALLOWED_IMAGE_FORMATS)}", None
+                
+                # Optional full integrity scan (PIL will raise exception if the file is corrupt)
+                if settings.STORAGE_VERIFY_IMAGE_INTEGRITY:
+                    image.verify()
             
             # Check dimensions (max 1920x1080 for 720p, but allow up to 1280x720 for MVP)
             max_width, max_height = 1280, 720
@@ -117,27 +248,31 @@ def validate_image(file_content: bytes, max_size_mb: float = 0.2) -> Tuple[bool,
             image_info = {
                 'width': width,
                 'height': height,
-                'format': image.format,
+                'format': image_format,
                 'size_bytes': size_bytes
             }
             
             return True, None, image_info
             
         except Exception as e:
+            # PIL's messages name internal objects; log them, don't return them
             logger.error(f"Image validation error: {str(e)}")
-            return False, f"Invalid image file: {str(e)}", None
+            return False, f"Invalid or corrupt {sniffed_format} image file", None
             
     except Exception as e:
         logger.error(f"Image validation exception: {str(e)}")
-        return False, f"Error validating image: {str(e)}", None
+        return False, "Error validating image", None
+    finally:
+        fileobj.seek(0)
 
 
-def upload_photo_to_s3(file_content: bytes, post_id: int, user_id: int, file_extension: str = "jpg") -> str:
+def upload_photo_to_s3(file_content: Union[bytes, BinaryIO], post_id: int, user_id: int, file_extension: str = "jpg") -> str:
     """
     Upload a photo to S3 and return the S3 key.
     
     Args:
-        file_content: Raw image bytes
+        file_content: Raw image bytes, or a seekable file object (e.g.
+            UploadFile.file) which is streamed without copying into memory
         post_id: ID of the post this photo belongs to
         user_id: ID of the user uploading the photo
         file_extension: File extension (jpg, png, webp)
@@ -146,43 +281,39 @@ def upload_photo_to_s3(file_content: bytes, post_id: int, user_id: int, file_ext
         S3 key (path) of the uploaded photo
     """
     client = get_s3_client()
+    from boto3.exceptions import S3UploadFailedError
+    from botocore.exceptions import ClientError
     
-    # Generate unique filename: posts/photos/{user_id}/{post_id}/{uuid}.{ext}
-    unique_id = str(uuid.uuid4())
-    timestamp = datetime.utcnow().strftime("%Y%m%d")
-    photo_prefix = settings.STORAGE_PHOTO_PREFIX or settings.S3_PHOTO_PREFIX
-    s3_key = f"{photo_prefix}/{user_id}/{post_id}/{timestamp}_{unique_id}.{file_extension}"
+    # Generate unique filename: posts/photos/{user_id}/{post_id}/{uuid7}.{ext}
+    unique_id = str(_uuid7())
+    s3_key = f"{_PHOTO_PREFIX}/{user_id}/{post_id}/{unique_id}.{file_extension}"
     
     try:
         # Upload to S3 with proper content type
-        content_type_map = {
-            'jpg': 'image/jpeg',
-            'jpeg': 'image/jpeg',
-            'png': 'image/png',
-            'webp': 'image/webp'
-        }
-        content_type = content_type_map.get(file_extension.lower(), 'image/jpeg')
+        content_type = _CONTENT_TYPE_GET(file_extension.lower(), 'image/jpeg')
         
-        bucket_name = settings.R2_BUCKET_NAME or settings.S3_BUCKET_NAME
-        client.put_object(
-            Bucket=bucket_name,
+        client.upload_fileobj(
+            Fileobj=_as_fileobj(file_content),
+            Bucket=_BUCKET,
             Key=s3_key,
-            Body=file_content,
-            ContentType=content_type,
-            CacheControl=settings.STORAGE_IMAGE_CACHE_CONTROL,
             # Note: ACL is not set - rely on bucket policies for access control
             # Objects are private by default
-            Metadata={
-                'post_id': str(post_id),
-                'user_id': str(user_id),
-                'uploaded_at': datetime.utcnow().isoformat()
-            }
+            ExtraArgs={
+                'ContentType': content_type,
+                'CacheControl': settings.STORAGE_IMAGE_CACHE_CONTROL,
+                'Metadata': {
+                    'post_id': str(post_id),
+                    'user_id': str(user_id),
+                    'uploaded_at': _utc_timestamp()
+                },
+            },
+            Config=get_transfer_config(),
         )
         
         logger.info(f"Successfully uploaded photo to S3: {s3_key}")
         return s3_key
         
-    except ClientError as e:
+    except (ClientError, S3UploadFailedError) as e:
         logger.error(f"Error uploading to S3: {str(e)}")
         raise Exception(f"Failed to upload photo to S3: {str(e)}")
 
@@ -208,18 +339,40 @@ def generate_presigned_url(
     Raises:
         Exception: If pre-signed URL generation fails (e.g., invalid credentials)
     """
+    if expiration is None:
+        expiration = _PRESIGNED_TTL
+    
+    # Signing is deterministic for a key/expiry pair, so reuse a recent URL
+    cache_key = (s3_key, expiration, response_cache_control)
+    now = time.monotonic()
+    cached = _PRESIGNED_CACHE.get(cache_key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    
     client = get_s3_client()
+    from botocore.exceptions import ClientError
     
-    if expiration is None:
-        expiration = settings.STORAGE_PRESIGNED_URL_EXPIRATION or settings.S3_PRESIGNED_URL_EXPIRATION
+    if settings.STORAGE_FAST_PRESIGN:
+        # Same URL botocore would produce, without its per-call request pipeline
+        url = presign_get_url(
+            endpoint_url=_ENDPOINT_URL,
+            bucket=_BUCKET,
+            key=s3_key,
+            access_key=_ACCESS_KEY,
+            secret_key=_SECRET_KEY,
+            region='auto',
+            expires_in=expiration,
+            response_cache_control=response_cache_control,
+        )
+        _cache_presigned_url(cache_key, url, now + expiration * _PRESIGNED_CACHE_REUSE_FRACTION)
+        return url
     
     try:
         # Generate pre-signed URL directly without checking object existence
         # Note: s3:GetObject IAM permission is required (not s3:HeadObject)
         # The URL will only work if the object exists when accessed
-        bucket_name = settings.R2_BUCKET_NAME or settings.S3_BUCKET_NAME
         params = {
-            'Bucket': bucket_name,
+            'Bucket': _BUCKET,
             'Key': s3_key
         }
         if response_cache_control:
@@ -230,6 +383,7 @@ def generate_presigned_url(
             ExpiresIn=expiration
         )
         logger.debug(f"Generated pre-signed URL for {s3_key}")
+        _cache_presigned_url(cache_key, url, now + expiration * _PRESIGNED_CACHE_REUSE_FRACTION)
         return url
         
     except ClientError as e:
@@ -237,8 +391,7 @@ def generate_presigned_url(
         error_message = e.response.get('Error', {}).get('Message', str(e))
         logger.error(f"Error generating pre-signed URL for {s3_key}")
         logger.error(f"Error Code: {error_code}, Message: {error_message}")
-        bucket_name = settings.R2_BUCKET_NAME or settings.S3_BUCKET_NAME
-        logger.error(f"Bucket: {bucket_name}")
+        logger.error(f"Bucket: {_BUCKET}")
         logger.error(f"Full error: {str(e)}")
         raise Exception(f"Failed to generate pre-signed URL ({error_code}): {error_message}")
 
@@ -258,15 +411,37 @@ def generate_presigned_urls(
     Returns:
         List of pre-signed URLs in the same order as input keys
     """
-    return [generate_presigned_url(key, expiration, response_cache_control) for key in s3_keys]
+    if expiration is None:
+        expiration = _PRESIGNED_TTL
+    
+    # Resolve cache hits in one pass, then sign only the misses.
+    # Signing is local CPU work under the GIL, so misses are signed inline
+    # rather than fanned out to a thread pool.
+    now = time.monotonic()
+    cache_get = _PRESIGNED_CACHE.get
+    urls: List[Optional[str]] = []
+    misses: List[int] = []
+    for index, key in enumerate(s3_keys):
+        cached = cache_get((key, expiration, response_cache_control))
+        if cached is not None and cached[1] > now:
+            urls.append(cached[0])
+        else:
+            urls.append(None)
+            misses.append(index)
+    
+    for index in misses:
+        urls[index] = generate_presigned_url(s3_keys[index], expiration, response_cache_control)
+    
+    return urls
 
 
-def upload_avatar_to_s3(file_content: bytes, user_id: int, file_extension: str = "jpg") -> str:
+def upload_avatar_to_s3(file_content: Union[bytes, BinaryIO], user_id: int, file_extension: str = "jpg") -> str:
     """
     Upload an avatar image to S3 and return the S3 key.
     
     Args:
-        file_content: Raw image bytes
+        file_content: Raw image bytes, or a seekable file object (e.g.
+            UploadFile.file) which is streamed without copying into memory
         user_id: ID of the user uploading the avatar
         file_extension: File extension (jpg, png, webp)
     
@@ -274,44 +449,44 @@ def upload_avatar_to_s3(file_content: bytes, user_id: int, file_extension: str =
         S3 key (path) of the uploaded avatar
     """
     client = get_s3_client()
+    from boto3.exceptions import S3UploadFailedError
+    from botocore.exceptions import ClientError
     
-    # Generate unique filename: users/avatars/{user_id}/{uuid}.{ext}
-    unique_id = str(uuid.uuid4())
-    timestamp = datetime.utcnow().strftime("%Y%m%d")
-    avatar_prefix = settings.STORAGE_AVATAR_PREFIX or settings.S3_AVATAR_PREFIX
-    s3_key = f"{avatar_prefix}/{user_id}/{timestamp}_{unique_id}.{file_extension}"
+    # Generate unique filename: users/avatars/{user_id}/{uuid7}.{ext}
+    unique_id = str(_uuid7())
+    s3_key = f"{_AVATAR_PREFIX}/{user_id}/{unique_id}.{file_extension}"
     
     try:
         # Upload to S3 with proper content type
-        content_type_map = {
-            'jpg': 'image/jpeg',
-            'jpeg': 'image/jpeg',
-            'png': 'image/png',
-            'webp': 'image/webp'
-        }
-        content_type = content_type_map.get(file_extension.lower(), 'image/jpeg')
+        content_type = _CONTENT_TYPE_GET(file_extension.lower(), 'image/jpeg')
         
-        bucket_name = settings.R2_BUCKET_NAME or settings.S3_BUCKET_NAME
-        client.put_object(
-            Bucket=bucket_name,
+        client.upload_fileobj(
+            Fileobj=_as_fileobj(file_content),
+            Bucket=_BUCKET,
             Key=s3_key,
-            Body=file_content,
-            ContentType=content_type,
-            CacheControl=settings.STORAGE_IMAGE_CACHE_CONTROL,
-            Metadata={
-                'user_id': str(user_id),
-                'uploaded_at': datetime.utcnow().isoformat()
-            }
+            ExtraArgs={
+                'ContentType': content_type,
+                'CacheControl': settings.STORAGE_IMAGE_CACHE_CONTROL,
+                'Metadata': {
+                    'user_id': str(user_id),
+                    'uploaded_at': _utc_timestamp()
+                },
+            },
+            Config=get_transfer_config(),
         )
         
         logger.info(f"Successfully uploaded avatar to S3: {s3_key}")
         return s3_key
         
-    except ClientError as e:
+    except (ClientError, S3UploadFailedError) as e:
         logger.error(f"Error uploading avatar to S3: {str(e)}")
         raise Exception(f"Failed to upload avatar to S3: {str(e)}")
 
 
+# DeleteObjects accepts at most 1000 keys per request
+_DELETE_BATCH_SIZE = 1000
+
+
 def delete_photo_from_s3(s3_key: str) -> bool:
     """
     Delete a photo from S3.
@@ -322,18 +497,49 @@ def delete_photo_from_s3(s3_key: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    client = get_s3_client()
+    return delete_photos_from_s3([s3_key])
+
+
+def delete_photos_from_s3(s3_keys: List[str]) -> bool:
+    """
+    Delete several photos from S3 with one DeleteObjects request per 1000 keys.
     
-    try:
-        bucket_name = settings.R2_BUCKET_NAME or settings.S3_BUCKET_NAME
-        client.delete_object(
-            Bucket=bucket_name,
-            Key=s3_key
-        )
-        logger.info(f"Successfully deleted photo from S3: {s3_key}")
+    Args:
+        s3_keys: S3 keys (paths) of the objects to delete
+    
+    Returns:
+        True if every object was deleted, False otherwise
+    """
+    if not s3_keys:
         return True
+    
+    client = get_s3_client()
+    from botocore.exceptions import ClientError
+    
+    all_deleted = True
+    for start in range(0, len(s3_keys), _DELETE_BATCH_SIZE):
+        batch = s3_keys[start:start + _DELETE_BATCH_SIZE]
+        try:
+            response = client.delete_objects(
+                Bucket=_BUCKET,
+                Delete={
+                    'Objects': [{'Key': key} for key in batch],
+                    'Quiet': True,  # Only failures are reported back
+                },
+            )
+        except ClientError as e:
+            logger.error(f"Error deleting from S3: {str(e)}")
+            all_deleted = False
+            continue
         
-    except ClientError as e:
-        logger.error(f"Error deleting from S3: {str(e)}")
-        return False
-
+        errors = response.get('Errors', [])
+        for error in errors:
+            logger.error(
+                f"Error deleting from S3 ({error.get('Key')}): "
+                f"{error.get('Code')} - {error.get('Message')}"
+            )
+        if errors:
+            all_deleted = False
+        logger.info(f"Deleted {len(batch) - len(errors)} of {len(batch)} photos from S3")
+    
+    return all_deleted
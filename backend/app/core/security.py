@@ -1,32 +1,33 @@
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+import time
 
-from jose import jwt, JWTError
+import jwt
 
 from app.config import settings
 
-def create_access_token(
-    subject: str | int,
-    expires_delta: Optional[timedelta] = None,
-):
-    if expires_delta is None:
-        expires_delta = timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-    to_encode = {
-        "sub": str(subject),
-        "exp": datetime.now(timezone.utc) + expires_delta,
-    }
+# Resolved once at import; settings are immutable at runtime
+_DEFAULT_EXPIRES_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_KEY = settings.SECRET_KEY
+_ALG = settings.ALGORITHM
+_ALGS = [_ALG]
 
+
+def create_access_token(subject: str | int):
+    """Mint a token with the default expiry (the common case)."""
     return jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM,
+        # PyJWT stores exp as integer seconds; skip the datetime round-trip
+        {"sub": str(subject), "exp": int(time.time()) + _DEFAULT_EXPIRES_SECONDS},
+        _KEY,
+        algorithm=_ALG,
     )
 
 def decode_access_token(token: str):
     return jwt.decode(
         token,
-        settings.SECRET_KEY,
-        algorithms=[settings.ALGORITHM],
+        _KEY,
+        algorithms=_ALGS,
     )
+
+
+# Run one encode/decode at import so the HMAC and base64 code paths are
+# loaded before the first request needs them
+decode_access_token(create_access_token("_warm"))
@@ -1,6 +1,8 @@
-from sqlalchemy import create_engine
+from sqlalchemy import DateTime, create_engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.expression import FunctionElement
 
 from app.config import settings
 
@@ -11,6 +13,13 @@ SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 # max_overflow: additional connections beyond pool_size
 # pool_pre_ping: verify connections before using (prevents stale connections)
 # pool_recycle: recycle connections after 1 hour to prevent stale connections
+# pool_use_lifo: reuse the most recently returned connection so idle ones can age out
+# query_cache_size: room for every distinct statement shape the routers emit
+# statement_timeout: stop runaway queries from pinning a pooled connection (PostgreSQL only)
+connect_args = {}
+if SQLALCHEMY_DATABASE_URL.startswith("postgresql"):
+    connect_args["options"] = "-c statement_timeout=30000"
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     poolclass=QueuePool,
@@ -18,6 +27,9 @@ engine = create_engine(
     max_overflow=15,  # Allow up to 23 total connections
     pool_pre_ping=True,  # Verify connections before using
     pool_recycle=3600,  # Recycle connections after 1 hour
+    pool_use_lifo=True,
+    query_cache_size=1200,
+    connect_args=connect_args,
 )
 
 SessionLocal = sessionmaker(
@@ -27,3 +39,32 @@ SessionLocal = sessionmaker(
 )
 
 Base = declarative_base()
+
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, evaluated by the database.
+
+    Used as a server_default so inserts don't build a datetime in Python and
+    PostgreSQL can return the value via RETURNING.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is UTC but only 'YYYY-MM-DD HH:MM:SS'. SQLite
+    # stores datetimes as text, so match the 'YYYY-MM-DD HH:MM:SS.ffffff' that
+    # SQLAlchemy's DateTime writes and binds; otherwise server-defaulted and
+    # Python-set values sort and compare inconsistently (%f is SS.SSS)
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
@@ -1,140 +1,267 @@
+import atexit
+import json
 import logging
+import queue
+import random
 import sys
 import time
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from anyio import to_thread
 from fastapi import FastAPI, Request, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from sqlalchemy import text
 from sqlalchemy.orm import Session
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from starlette.middleware.base import BaseHTTPMiddleware
-from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.routers import auth, posts, feed, connections, tags, connection_tags, insights, comments, digest, replies, images, notifications, reactions
 from app.config import settings
 from app.core.exceptions import AppException
+from app.core.metrics import setup_instrumentation
+from app.core.rate_limit import limiter
 from app.core.deps import get_db
+from app.core.oauth import close_google_client
 
 # Configure logging
+# Records are handed to a bounded queue and written to stdout by a listener
+# thread, so request handlers never block on a slow stdout pipe.
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full."""
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+_log_queue = queue.Queue(maxsize=10_000)
+_queue_handler = DroppingQueueHandler(_log_queue)
+# Only merge the message args here; the listener applies the full format
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)],
+    handlers=[_queue_handler],
 )
+_log_listener = QueueListener(_log_queue, _stdout_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush whatever is still queued on shutdown
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Size the worker pool that sync endpoints and offloaded CPU work share
+    to_thread.current_default_thread_limiter().total_tokens = settings.WORKER_THREADS
+    yield
+    # Release pooled keep-alive connections to Google
+    await close_google_client()
+
+
 app = FastAPI(
     title="Intentional Social",
     description="A social platform focused on intentional connections",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,  # orjson serializes feed payloads much faster than stdlib json
+    lifespan=lifespan,
 )
 
 logger.info("Application starting...")
 
 # Initialize Prometheus metrics
-Instrumentator().instrument(app).expose(app)
-logger.info("Prometheus metrics enabled at /metrics")
+setup_instrumentation(app)
+if settings.ENABLE_METRICS:
+    logger.info("Prometheus metrics enabled at /metrics")
 
 
 # Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-# Share limiter with auth router (after import to avoid circular dependency)
-auth.limiter = limiter
+# Compress feed-sized JSON; small bodies (health checks, acks) are sent as-is.
+# Registered first so it is the innermost middleware, right next to the endpoint.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
 
 # Security headers middleware
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    response = await call_next(request)
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-    return response
+# Pure ASGI (not @app.middleware("http")): BaseHTTPMiddleware runs every request
+# through an extra task group and re-streams the response body.
+# Headers are pre-encoded once and added to the raw ASGI header list. A new list
+# is built rather than extended in place: Starlette responses send their own
+# raw_headers list, which must not grow on every send.
+_SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+)
+
+
+class SecurityHeadersMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *_SECURITY_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+app.add_middleware(SecurityHeadersMiddleware)
 
 
 # Request size limit middleware (security)
-@app.middleware("http")
-async def request_size_limit(request: Request, call_next):
-    """Limit request size to prevent memory exhaustion attacks."""
-    max_size = 10 * 1024 * 1024  # 10MB
-    
-    if request.headers.get("content-length"):
-        content_length = int(request.headers["content-length"])
-        if content_length > max_size:
-            return JSONResponse(
-                status_code=413,
-                content={
-                    "error": {
-                        "type": "RequestTooLarge",
-                        "message": "Request size exceeds maximum allowed (10MB)",
-                        "status_code": 413
-                    }
-                }
-            )
-    
-    return await call_next(request)
+# Limit request size to prevent memory exhaustion attacks. Reads Content-Length
+# straight from the raw ASGI headers; bodiless methods skip the check entirely.
+_MAX_REQUEST_SIZE = 10 * 1024 * 1024  # 10MB
+_BODYLESS_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "DELETE"))
+_TOO_LARGE_BODY = json.dumps(
+    {
+        "error": {
+            "type": "RequestTooLarge",
+            "message": "Request size exceeds maximum allowed (10MB)",
+            "status_code": 413
+        }
+    },
+    separators=(",", ":"),
+).encode()
+_TOO_LARGE_START = {
+    "type": "http.response.start",
+    "status": 413,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_TOO_LARGE_BODY)).encode()),
+    ],
+}
+
+
+class RequestSizeLimitMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] not in _BODYLESS_METHODS:
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > _MAX_REQUEST_SIZE:
+                        # Copy: downstream senders may add headers to the message
+                        await send({**_TOO_LARGE_START, "headers": list(_TOO_LARGE_START["headers"])})
+                        await send({"type": "http.response.body", "body": _TOO_LARGE_BODY})
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(RequestSizeLimitMiddleware)
 
 # Request logging middleware (optimized for production)
 # Only log slow requests (>1s), errors, or critical endpoints to reduce CPU overhead
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
-    
-    # Skip logging for health checks and metrics (high frequency, low value)
-    if request.url.path in ["/health", "/metrics"]:
-        response = await call_next(request)
-        return response
-    
-    response = await call_next(request)
-    
-    # Calculate duration
-    duration = time.time() - start_time
-    
-    # Only log slow requests (>1s), errors (4xx/5xx), or auth endpoints
-    should_log = (
-        duration > 1.0 or  # Slow requests
-        response.status_code >= 400 or  # Errors
-        request.url.path.startswith("/auth/")  # Auth endpoints (important for security)
-    )
-    
-    if should_log:
-        logger.info(
-            f"{request.method} {request.url.path} - "
-            f"Status: {response.status_code} - Duration: {duration:.2f}s - "
-            f"IP: {request.client.host if request.client else 'unknown'}"
+# Health checks and metrics are skipped entirely (high frequency, low value)
+_SKIP_LOG_PATHS = frozenset(("/health", "/metrics"))
+_LOG_SAMPLE_RATE = settings.LOG_SAMPLE_RATE
+
+
+class RequestLogMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in _SKIP_LOG_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_with_status)
+
+        # Calculate duration
+        duration = time.perf_counter() - start_time
+        path = scope["path"]
+
+        # Always log slow requests (>1s), errors (4xx/5xx), or auth endpoints;
+        # everything else only at LOG_SAMPLE_RATE
+        should_log = (
+            duration > 1.0 or  # Slow requests
+            status_code >= 400 or  # Errors
+            path.startswith("/auth/") or  # Auth endpoints (important for security)
+            (_LOG_SAMPLE_RATE > 0.0 and random.random() < _LOG_SAMPLE_RATE)
         )
-    
-    return response
+
+        if should_log:
+            client = scope.get("client")
+            # Lazy %-args: the string is only built if the record is emitted
+            logger.info(
+                "%s %s - Status: %d - Duration: %.2fs - IP: %s",
+                scope["method"],
+                path,
+                status_code,
+                duration,
+                client[0] if client else "unknown",
+            )
+
+
+app.add_middleware(RequestLogMiddleware)
 
 
 # CORS configuration from environment variables
+# Parsed once: whitespace and trailing slashes are stripped (browsers send the
+# Origin header without either), and a frozenset makes each origin check O(1).
+CORS_ORIGINS = frozenset(
+    origin.strip().rstrip("/")
+    for origin in settings.CORS_ORIGINS.split(",")
+    if origin.strip()
+)
+if "*" in CORS_ORIGINS:
+    CORS_ORIGINS = frozenset(("*",))
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS.split(","),
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
-    expose_headers=["*"],
+    # Explicit lists (rather than "*") let browsers cache preflights for max_age seconds
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With"],
+    expose_headers=["Content-Length", "X-Next-Cursor"],
+    max_age=600,
 )
 
-app.include_router(auth.router)
-app.include_router(posts.router)
-app.include_router(feed.router)
-app.include_router(digest.router)
-app.include_router(connections.router)
-app.include_router(connection_tags.router)
-app.include_router(tags.router)
-app.include_router(insights.router)
-app.include_router(comments.router)
-app.include_router(replies.router)
-app.include_router(reactions.router)
-app.include_router(images.router)
-app.include_router(notifications.router)
+for router_module in (
+    auth,
+    posts,
+    feed,
+    digest,
+    connections,
+    connection_tags,
+    tags,
+    insights,
+    comments,
+    replies,
+    reactions,
+    images,
+    notifications,
+):
+    app.include_router(router_module.router)
 
 
 # Global exception handlers
@@ -179,17 +306,38 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
-@app.get("/health")
-def health():
-    return {"status": "ok"}
+# Liveness probes hit this constantly, so /health is a raw ASGI endpoint: no
+# Request object, dependency resolution or serialization, just a fixed body.
+HEALTH_OK = b'{"status":"ok"}'
+
+
+class HealthEndpoint:
+    async def __call__(self, scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            # Fresh list per call: downstream middlewares may add headers
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", b"%d" % len(HEALTH_OK)),
+            ],
+        })
+        await send({"type": "http.response.body", "body": HEALTH_OK})
+
+
+# A callable instance (not a function) is mounted as-is rather than wrapped
+app.router.add_route("/health", HealthEndpoint(), methods=["GET"], include_in_schema=False)
+
+
+DB_HEALTHY = b'{"status":"healthy","database":"connected"}'
 
 
 @app.get("/health/db")
 def health_db(db: Session = Depends(get_db)):
     """Check database connectivity."""
     try:
-        db.execute("SELECT 1")
-        return {"status": "healthy", "database": "connected"}
+        db.execute(text("SELECT 1"))
+        return Response(DB_HEALTHY, media_type="application/json")
     except Exception as e:
         logger.error(f"Database health check failed: {str(e)}")
         return JSONResponse(
@@ -1,6 +1,8 @@
 from app.db import Base  # re-export for Alembic convenience
 
-# Import all models for Alembic
+# Import all models eagerly: relationships name their targets as strings
+# ("User", "PostStats", ...), so every mapped class must be registered before
+# the first query configures the mappers.
 from app.models.user import User
 from app.models.connection import Connection
 from app.models.post import Post
@@ -11,6 +13,7 @@ from app.models.comment import Comment
 from app.models.reply import Reply
 from app.models.reaction import Reaction
 from app.models.reported_post import ReportedPost
+from app.models.email_verification import EmailVerification
 from app.models.notification import Notification
 from app.models.post_stats import PostStats
 # MVP TEMPORARY: Registration request model - remove when moving beyond MVP
@@ -1,9 +1,10 @@
-from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, event
-from sqlalchemy.orm import relationship
+from collections import Counter
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Index, event
+from sqlalchemy.orm import Session, relationship
 from sqlalchemy.sql import text
 
-from app.db import Base
+from app.db import Base, utcnow
+from app.models.post import Post
 
 
 class Comment(Base):
@@ -13,7 +14,13 @@ class Comment(Base):
     post_id = Column(Integer, ForeignKey("posts.id"), nullable=False, index=True)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     content = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+
+    # Comments are always listed per post in (created_at, id) order; id breaks
+    # ties so keyset pagination can resume from a cursor via this index alone
+    __table_args__ = (
+        Index('ix_comments_post_created_id', 'post_id', 'created_at', 'id'),
+    )
 
     # Relationships
     post = relationship("Post", back_populates="comments")
@@ -21,17 +28,35 @@ class Comment(Base):
     replies = relationship("Reply", back_populates="comment", cascade="all, delete-orphan")
 
 
-@event.listens_for(Comment, "after_delete")
-def decrement_comment_count(mapper, connection, target):
-    """Decrement comment_count in PostStats when a comment is deleted."""
-    # Use raw SQL via connection to update PostStats
-    # This works for both individual and cascade deletes
-    connection.execute(
-        text("""
-            UPDATE post_stats 
-            SET comment_count = GREATEST(0, comment_count - 1)
-            WHERE post_id = :post_id
-        """),
-        {"post_id": target.post_id}
-    )
-
+@event.listens_for(Session, "before_flush")
+def decrement_comment_counts(session, flush_context, instances):
+    """Decrement comment_count in PostStats for comments deleted in this flush.
+    
+    Deletes are aggregated per post so cascade deletes issue one UPDATE per
+    post instead of one per comment. Comments whose post is being deleted in
+    the same flush are skipped: the post's PostStats row goes with it.
+    """
+    if not session.deleted:
+        return
+    
+    deleted_post_ids = set()
+    deleted_comments = Counter()
+    for obj in session.deleted:
+        if isinstance(obj, Comment):
+            deleted_comments[obj.post_id] += 1
+        elif isinstance(obj, Post):
+            deleted_post_ids.add(obj.id)
+    
+    # Use raw SQL via the session's connection to update PostStats
+    connection = session.connection()
+    for post_id, count in deleted_comments.items():
+        if post_id in deleted_post_ids:
+            continue
+        connection.execute(
+            text("""
+                UPDATE post_stats 
+                SET comment_count = CASE WHEN comment_count > :count THEN comment_count - :count ELSE 0 END
+                WHERE post_id = :post_id
+            """),
+            {"post_id": post_id, "count": count}
+        )
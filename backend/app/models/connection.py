@@ -3,7 +3,7 @@ from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from enum import Enum
 
-from app.db import Base
+from app.db import Base, utcnow
 
 
 class ConnectionStatus(str, Enum):
@@ -21,12 +21,12 @@ class Connection(Base):
     user_b_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     initiated_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     status = Column(
-        SQLEnum(ConnectionStatus, native_enum=True, values_callable=lambda x: [e.value for e in x]),
+        SQLEnum(ConnectionStatus, name="connectionstatus", native_enum=True, values_callable=lambda x: [e.value for e in x]),
         default=ConnectionStatus.PENDING,
         nullable=False
     )
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=lambda: datetime.now(timezone.utc))
 
     # Relationships
     user_a = relationship("User", foreign_keys=[user_a_id], backref="connections_as_a")
@@ -36,8 +36,9 @@ class Connection(Base):
     # Constraints
     __table_args__ = (
         UniqueConstraint('user_a_id', 'user_b_id', name='unique_connection'),
-        Index('idx_user_a', 'user_a_id'),
-        Index('idx_user_b', 'user_b_id'),
-        Index('idx_status', 'status'),
+        # Lookups always pair a side with a status; the leading column also
+        # serves plain per-user lookups
+        Index('ix_conn_user_a_status', 'user_a_id', 'status'),
+        Index('ix_conn_user_b_status', 'user_b_id', 'status'),
         Index('idx_initiated_by_user', 'initiated_by_user_id'),
     )
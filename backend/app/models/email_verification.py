@@ -1,8 +1,7 @@
-from datetime import datetime, timezone, timedelta
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 
-from app.db import Base
+from app.db import Base, utcnow
 
 
 class EmailVerification(Base):
@@ -11,11 +10,21 @@ class EmailVerification(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)  # Nullable for registration OTPs
     email = Column(String(255), nullable=False)
-    otp_code = Column(String(6), nullable=False)  # 6-digit OTP
+    otp_code = Column(Integer, nullable=False)  # 6-digit OTP, zero-padded only for display
     expires_at = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     verified_at = Column(DateTime, nullable=True)
 
     # Relationship
     user = relationship("User", backref="email_verifications")
 
+    # Only unverified OTPs are ever looked up, so keep just those in the index
+    __table_args__ = (
+        Index(
+            'ix_email_verif_active',
+            'email',
+            'otp_code',
+            postgresql_where=text('verified_at IS NULL'),
+        ),
+    )
+
@@ -1,8 +1,7 @@
-from datetime import datetime, timezone
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
-from app.db import Base
+from app.db import Base, utcnow
 
 
 class Notification(Base):
@@ -14,7 +13,7 @@ class Notification(Base):
     post_id = Column(Integer, ForeignKey("posts.id"), nullable=False, index=True)
     comment_id = Column(Integer, ForeignKey("comments.id"), nullable=True, index=True)
     type = Column(String(20), nullable=False)  # 'comment' or 'reply'
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     read_at = Column(DateTime, nullable=True)
 
     # Relationships
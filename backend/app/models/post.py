@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Float
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 
 from app.db import Base
@@ -12,7 +13,8 @@ class Post(Base):
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
     audience_type = Column(String(20), default="all")  # 'all', 'tags', 'connections', 'private'
-    photo_urls = Column(JSON, default=lambda: [])  # List of S3 keys for photos
+    # List of S3 keys for photos; native text[] on PostgreSQL skips the JSON round-trip
+    photo_urls = Column(JSON().with_variant(ARRAY(Text), "postgresql"), default=list, nullable=False)
     created_at = Column(DateTime, nullable=False)  # Set explicitly using client time
     
     # Digest fields
@@ -1,8 +1,7 @@
-from datetime import datetime, timezone
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 
-from app.db import Base
+from app.db import Base, utcnow
 
 
 class Reaction(Base):
@@ -12,7 +11,7 @@ class Reaction(Base):
     post_id = Column(Integer, ForeignKey("posts.id"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     emoji = Column(String(10), nullable=False)  # Store emoji as string (e.g., "👍", "❤️", "😊")
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     # Ensure one reaction per user per post (user can change their reaction)
     __table_args__ = (
@@ -8,12 +8,11 @@ TODO: Remove this entire file and related code when moving beyond MVP phase.
 See backend/app/routers/auth.py and observability/backend/app/routers/moderation.py
 for related code that should also be removed.
 """
-from datetime import datetime, timezone
 from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 import enum
 
-from app.db import Base
+from app.db import Base, utcnow
 
 
 class RegistrationStatus(enum.Enum):
@@ -44,7 +43,7 @@ class RegistrationRequest(Base):
     status = Column(SQLEnum(RegistrationStatus), default=RegistrationStatus.PENDING, nullable=False, index=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False, index=True)
     reviewed_at = Column(DateTime, nullable=True)
     reviewed_by_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     
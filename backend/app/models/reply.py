@@ -1,8 +1,7 @@
-from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
-from app.db import Base
+from app.db import Base, utcnow
 
 
 class Reply(Base):
@@ -12,7 +11,12 @@ class Reply(Base):
     comment_id = Column(Integer, ForeignKey("comments.id"), nullable=False, index=True)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     content = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+
+    # Replies are always listed per comment in created_at order
+    __table_args__ = (
+        Index('ix_replies_comment_created', 'comment_id', 'created_at'),
+    )
 
     # Relationships
     comment = relationship("Comment", back_populates="replies")
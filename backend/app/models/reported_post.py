@@ -1,8 +1,7 @@
-from datetime import datetime, timezone
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 
-from app.db import Base
+from app.db import Base, utcnow
 
 
 class ReportedPost(Base):
@@ -12,7 +11,7 @@ class ReportedPost(Base):
     post_id = Column(Integer, ForeignKey("posts.id"), nullable=False, index=True)
     reported_by_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     reason = Column(Text, nullable=True)  # Optional reason for the report
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     resolved_at = Column(DateTime, nullable=True)
     resolved_by_id = Column(Integer, ForeignKey("users.id"), nullable=True)
 
@@ -1,8 +1,7 @@
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
 
-from app.db import Base
+from app.db import Base, utcnow
 
 
 class Tag(Base):
@@ -12,10 +11,11 @@ class Tag(Base):
     owner_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     name = Column(String(24), nullable=False)
     color_scheme = Column(String(20), default="generic")  # family, friends, inner, work, custom, generic
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, server_default=utcnow())
 
     # Relationships
     owner = relationship("User", backref="tags")
+    user_tags = relationship("UserTag", back_populates="tag")
 
     # Constraints
     __table_args__ = (
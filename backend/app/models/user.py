@@ -1,8 +1,8 @@
-from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
-from app.db import Base
+from app.db import Base, utcnow
 
 
 class User(Base):
@@ -19,16 +19,33 @@ class User(Base):
     avatar_url = Column(String(500), nullable=True)  # User-customizable override for picture_url
     bio = Column(String(500), nullable=True)  # User bio/note
     is_banned = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
-    posts = relationship("Post", back_populates="author", cascade="all, delete-orphan")
-    comments = relationship("Comment", back_populates="author", cascade="all, delete-orphan")
-    replies = relationship("Reply", back_populates="author", cascade="all, delete-orphan")
-    reactions = relationship("Reaction", back_populates="user", cascade="all, delete-orphan")
+    # Serves the case-insensitive email lookup in user search
+    __table_args__ = (
+        Index('ix_users_email_lower', func.lower(email)),
+    )
+
+    posts = relationship("Post", back_populates="author", cascade="all, delete-orphan", lazy="raise")
+    comments = relationship("Comment", back_populates="author", cascade="all, delete-orphan", lazy="raise")
+    replies = relationship("Reply", back_populates="author", cascade="all, delete-orphan", lazy="raise")
+    reactions = relationship("Reaction", back_populates="user", cascade="all, delete-orphan", lazy="raise")
+    tags_owned = relationship("UserTag", foreign_keys="UserTag.owner_user_id", back_populates="owner", lazy="raise")
+    tags_received = relationship("UserTag", foreign_keys="UserTag.target_user_id", back_populates="target", lazy="raise")
     
+    @hybrid_property
+    def effective_display_name(self) -> str:
+        """Display name, preferring user override over Google full_name."""
+        return self.display_name or self.full_name or self.username
+
+    @effective_display_name.expression
+    def effective_display_name(cls):
+        # Same fallback chain, resolved in SQL so queries can select it as one column
+        return func.coalesce(cls.display_name, cls.full_name, cls.username)
+
     def get_display_name(self) -> str:
         """Get display name, preferring user override over Google full_name."""
-        return self.display_name or self.full_name or self.username
+        return self.effective_display_name
     
     def get_avatar_url(self) -> str | None:
         """Get avatar URL, preferring user override over Google picture_url."""
@@ -1,8 +1,7 @@
 from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
 
-from app.db import Base
+from app.db import Base, utcnow
 
 
 class UserTag(Base):
@@ -12,17 +11,20 @@ class UserTag(Base):
     owner_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)  # who is tagging
     target_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)  # who is being tagged
     tag_id = Column(Integer, ForeignKey("tags.id"), nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, server_default=utcnow())
 
-    # Relationships
-    owner = relationship("User", foreign_keys=[owner_user_id], backref="tags_owned")
-    target = relationship("User", foreign_keys=[target_user_id], backref="tags_received")
-    tag = relationship("Tag", backref="user_tags")
+    # Relationships: never lazy-load per row; callers opt in with
+    # joinedload/selectinload where they actually render them
+    owner = relationship("User", foreign_keys=[owner_user_id], back_populates="tags_owned", lazy="raise")
+    target = relationship("User", foreign_keys=[target_user_id], back_populates="tags_received", lazy="raise")
+    tag = relationship("Tag", back_populates="user_tags", lazy="raise")
 
     # Constraints
     __table_args__ = (
         UniqueConstraint('owner_user_id', 'target_user_id', 'tag_id', name='unique_user_tag_assignment'),
-        Index('idx_owner_user', 'owner_user_id'),
+        # Feed/digest filters resolve "whom did I tag with X" from the index
+        # alone; plain owner lookups use the unique constraint's prefix
+        Index('ix_user_tags_owner_tag_target', 'owner_user_id', 'tag_id', 'target_user_id'),
         Index('idx_target_user', 'target_user_id'),
         Index('idx_tag', 'tag_id'),
     )
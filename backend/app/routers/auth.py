@@ -1,26 +1,28 @@
 from datetime import datetime, timezone
 import logging
 from functools import wraps
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from fastapi.responses import RedirectResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from sqlalchemy import exists, func, or_, select
+from sqlalchemy.exc import IntegrityError
 
 from fastapi import UploadFile, File, Form
 from app.core.deps import get_db, get_current_user
+from app.core.rate_limit import rate_limit
 from app.core.security import create_access_token
 from app.core.oauth import (
     generate_pkce_pair,
     generate_state,
     get_google_authorization_url,
     exchange_code_for_tokens,
-    verify_google_id_token,
+    verify_google_id_token_cached,
     get_google_user_info,
 )
 from app.core.image_urls import build_image_path, is_storage_key
-from app.core.s3 import validate_image, upload_avatar_to_s3, delete_photo_from_s3
+from app.core.s3 import IMAGE_FORMAT_EXTENSIONS, validate_image, upload_avatar_to_s3, delete_photo_from_s3
 from app.config import settings
 from app.models.user import User
 # MVP TEMPORARY: Registration request model - remove when moving beyond MVP
@@ -31,25 +33,6 @@ from app.schemas.auth import Token, GoogleOAuthCallbackRequest, GoogleOAuthCallb
 router = APIRouter(prefix="/auth", tags=["Auth"])
 logger = logging.getLogger(__name__)
 
-# Rate limiter will be set by main.py after app initialization
-limiter = None
-
-
-def rate_limit(limit_str: str):
-    """Helper function to conditionally apply rate limiting.
-    Returns a no-op decorator if limiter is None.
-    The actual rate limiting will be applied in main.py after limiter is initialized.
-    """
-    def decorator(func):
-        # Store the limit string as an attribute so we can apply it later
-        func._rate_limit = limit_str
-        # If limiter is already set, apply it now
-        if limiter is not None:
-            return limiter.limit(limit_str)(func)
-        # Otherwise, return function unchanged (will be applied in main.py)
-        return func
-    return decorator
-
 
 @router.get("/google/authorize")
 @rate_limit("10/minute")
@@ -109,6 +92,99 @@ async def google_oauth_callback_get(
     return RedirectResponse(url=frontend_url)
 
 
+def _find_or_register_google_user(
+    db: Session,
+    google_id: str,
+    email: str,
+    full_name: Optional[str],
+    picture_url: Optional[str],
+) -> User:
+    """
+    Return the user for a verified Google identity.
+    Unknown identities get a pending registration request and a 403.
+    """
+    # Check if user exists by google_id
+    user = db.query(User).filter(User.google_id == google_id).first()
+    
+    if user:
+        # Existing user - update info if needed
+        if full_name and not user.full_name:
+            user.full_name = full_name
+        if picture_url and not user.picture_url:
+            user.picture_url = picture_url
+        # Returning logins usually change nothing; skip the commit (and the
+        # reload it would force) unless a field was actually filled in
+        if db.dirty:
+            db.commit()
+            db.refresh(user)
+    else:
+        # MVP TEMPORARY: New user registration flow - create registration request instead of user
+        # TODO: Remove this when moving beyond MVP and create users directly
+        
+        # One round trip for all three pre-checks:
+        # - email already registered (shouldn't happen, but safety check)
+        # - a registration request already pending
+        # - an approved request (user should exist, but handle edge case)
+        email_taken, pending_request_exists, approved_request_exists = db.execute(
+            select(
+                exists().where(User.email == email),
+                exists().where(
+                    RegistrationRequest.google_id == google_id,
+                    RegistrationRequest.status == RegistrationStatus.PENDING
+                ),
+                exists().where(
+                    RegistrationRequest.google_id == google_id,
+                    RegistrationRequest.status == RegistrationStatus.APPROVED
+                ),
+            )
+        ).one()
+        
+        if email_taken:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered with different account"
+            )
+        
+        if pending_request_exists:
+            # Registration request already exists and is pending
+            logger.info(f"Registration request already exists for {email}, returning waitlist response")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Your registration request is pending approval. Please wait for admin approval."
+            )
+        
+        if approved_request_exists:
+            # Request was approved but user doesn't exist - this shouldn't happen
+            # but handle it gracefully
+            logger.warning(f"Approved registration request exists for {email} but user not found")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Your registration was approved but account creation failed. Please contact support."
+            )
+        
+        # Create registration request
+        reg_request = RegistrationRequest(
+            email=email,
+            google_id=google_id,
+            full_name=full_name,
+            picture_url=picture_url,
+            status=RegistrationStatus.PENDING,
+        )
+        db.add(reg_request)
+        db.commit()
+        db.refresh(reg_request)
+        
+        logger.info(f"Registration request created for {email} (request ID: {reg_request.id})")
+        
+        # Return error indicating they need to wait for approval
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Your registration request has been submitted and is pending admin approval. You will be notified once approved."
+        )
+    
+    return user
+
+
 @router.post("/google/callback", response_model=GoogleOAuthCallbackResponse)
 @rate_limit("10/minute")
 async def google_oauth_callback(
@@ -137,7 +213,8 @@ async def google_oauth_callback(
             )
         
         # Verify token signature and get user info
-        google_user_info = verify_google_id_token(id_token_str)
+        # (RSA verification + Google cert fetch are blocking; keep them off the event loop)
+        google_user_info = await run_in_threadpool(verify_google_id_token_cached, id_token_str)
         
         # Extract user data from Google
         google_id = google_user_info.get("sub")
@@ -151,77 +228,10 @@ async def google_oauth_callback(
                 detail="Missing required information from Google"
             )
         
-        # Check if user exists by google_id
-        user = db.query(User).filter(User.google_id == google_id).first()
-        
-        if user:
-            # Existing user - update info if needed
-            if full_name and not user.full_name:
-                user.full_name = full_name
-            if picture_url and not user.picture_url:
-                user.picture_url = picture_url
-            db.commit()
-            db.refresh(user)
-        else:
-            # MVP TEMPORARY: New user registration flow - create registration request instead of user
-            # TODO: Remove this when moving beyond MVP and create users directly
-            
-            # Check if email already exists (shouldn't happen, but safety check)
-            existing_by_email = db.query(User).filter(User.email == email).first()
-            if existing_by_email:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered with different account"
-                )
-            
-            # Check if there's already a pending registration request
-            existing_request = db.query(RegistrationRequest).filter(
-                RegistrationRequest.google_id == google_id,
-                RegistrationRequest.status == RegistrationStatus.PENDING
-            ).first()
-            
-            if existing_request:
-                # Registration request already exists and is pending
-                logger.info(f"Registration request already exists for {email}, returning waitlist response")
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Your registration request is pending approval. Please wait for admin approval."
-                )
-            
-            # Check if there's an approved request (user should exist, but handle edge case)
-            approved_request = db.query(RegistrationRequest).filter(
-                RegistrationRequest.google_id == google_id,
-                RegistrationRequest.status == RegistrationStatus.APPROVED
-            ).first()
-            
-            if approved_request:
-                # Request was approved but user doesn't exist - this shouldn't happen
-                # but handle it gracefully
-                logger.warning(f"Approved registration request exists for {email} but user not found")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Your registration was approved but account creation failed. Please contact support."
-                )
-            
-            # Create registration request
-            reg_request = RegistrationRequest(
-                email=email,
-                google_id=google_id,
-                full_name=full_name,
-                picture_url=picture_url,
-                status=RegistrationStatus.PENDING,
-            )
-            db.add(reg_request)
-            db.commit()
-            db.refresh(reg_request)
-            
-            logger.info(f"Registration request created for {email} (request ID: {reg_request.id})")
-            
-            # Return error indicating they need to wait for approval
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Your registration request has been submitted and is pending admin approval. You will be notified once approved."
-            )
+        # Sync Session work; run it on the threadpool so the event loop stays free
+        user = await run_in_threadpool(
+            _find_or_register_google_user, db, google_id, email, full_name, picture_url
+        )
         
         # Generate our JWT token
         token = create_access_token(subject=user.id)
@@ -234,7 +244,7 @@ async def google_oauth_callback(
             "token_type": "bearer",
             "needs_username": needs_username,
             "needs_waitlist": False,  # Approved users don't need waitlist
-            "user": UserOut.model_validate(user),
+            "user": UserOut.from_user(user),
         }
         
     except HTTPException:
@@ -267,31 +277,46 @@ def select_username(
             detail="Username has already been set and cannot be changed"
         )
     
-    # Check if username is already taken
-    existing_user = db.query(User).filter(
-        User.username == payload.username,
-        User.id != current_user.id
-    ).first()
-    
-    if existing_user:
+    # Set username (permanent, cannot be changed); the unique index on
+    # username rejects a taken name, so no separate lookup is needed
+    current_user.username = payload.username
+    # Build the response from the in-memory state before commit expires it;
+    # nothing server-side changes on this update, so no reload is needed
+    user_out = UserOut.from_user(current_user)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken"
         )
     
-    # Set username (permanent, cannot be changed)
-    current_user.username = payload.username
-    db.commit()
-    db.refresh(current_user)
-    
-    logger.info(f"User {current_user.id} set username to {payload.username}")
-    return UserOut.model_validate(current_user)
+    logger.info(f"User {user_out.id} set username to {payload.username}")
+    return user_out
 
 
 @router.get("/users", response_model=list[UserOut])
-def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+def get_users(
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
+    """List users in id order. Pass the last id seen as after_id to page without OFFSET."""
+    query = db.query(User).order_by(User.id)
+    if after_id is not None:
+        # Keyset: a primary-key range scan, however deep the page
+        query = query.filter(User.id > after_id)
+    else:
+        query = query.offset(skip)
+    users = query.limit(limit).all()
+    return [UserOut.from_user(user) for user in users]
+
+
+# Exact matches on two unique columns can return at most two rows; the cap
+# just bounds the query if matching is ever loosened
+SEARCH_RESULT_LIMIT = 20
 
 
 @router.get("/users/search", response_model=list[UserOut])
@@ -307,23 +332,28 @@ def search_users(
             detail="Search query must be at least 2 characters",
         )
     
-    # Exact match on username or email
+    # Exact, case-insensitive match on username or email, excluding the
+    # current user. Usernames are stored lowercase, so normalizing q keeps
+    # them on the plain unique index; stored emails may have capitals, so
+    # they are compared via lower(email), served by ix_users_email_lower.
+    q_lower = q.strip().lower()
     results = (
         db.query(User)
-        .filter(or_(User.username == q, User.email == q))
+        .filter(
+            or_(User.username == q_lower, func.lower(User.email) == q_lower),
+            User.id != current_user.id,
+        )
+        .limit(SEARCH_RESULT_LIMIT)
         .all()
     )
 
-    # Exclude current user from search results
-    results = [u for u in results if u.id != current_user.id]
-
-    return results
+    return [UserOut.from_user(user) for user in results]
 
 
 @router.get("/me", response_model=UserOut)
 def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current authenticated user's details"""
-    user_out = UserOut.model_validate(current_user)
+    user_out = UserOut.from_user(current_user)
     
     # If avatar_url is a storage key, return stable image URL
     if is_storage_key(user_out.avatar_url):
@@ -347,7 +377,7 @@ def get_user_by_username(
             detail="User not found"
         )
     
-    user_out = UserOut.model_validate(user)
+    user_out = UserOut.from_user(user)
     
     # If avatar_url is a storage key, return stable image URL
     if is_storage_key(user_out.avatar_url):
@@ -359,6 +389,7 @@ def get_user_by_username(
 @router.put("/me/avatar", response_model=UserOut)
 @rate_limit("10/minute")
 async def update_user_avatar(
+    request: Request,
     avatar: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -368,30 +399,21 @@ async def update_user_avatar(
     Accepts multipart/form-data with avatar file.
     """
     try:
-        # Read file content
-        file_content = await avatar.read()
+        # Validate and upload straight from the spooled upload file;
+        # no copy of the payload is made in Python memory
+        file_content = avatar.file
         
-        # Validate image
-        is_valid, error_msg, image_info = validate_image(file_content, max_size_mb=0.2)
+        # Validate image (PIL parsing is CPU work; run it off the event loop)
+        is_valid, error_msg, image_info = await run_in_threadpool(validate_image, file_content, 0.2)
         if not is_valid:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Avatar validation failed: {error_msg}"
             )
         
-        # Determine file extension from content type or filename
-        file_extension = "jpg"  # default
-        if avatar.filename:
-            if avatar.filename.lower().endswith(('.png',)):
-                file_extension = "png"
-            elif avatar.filename.lower().endswith(('.webp',)):
-                file_extension = "webp"
-        elif image_info and image_info.get('format'):
-            format_lower = image_info['format'].lower()
-            if format_lower == 'png':
-                file_extension = "png"
-            elif format_lower == 'webp':
-                file_extension = "webp"
+        # Name the object after the format validate_image detected from
+        # the bytes; the client-supplied filename can't be trusted
+        file_extension = IMAGE_FORMAT_EXTENSIONS[image_info['format']]
         
         # Delete old avatar if it exists
         if current_user.avatar_url:
@@ -399,22 +421,21 @@ async def update_user_avatar(
             avatar_prefix = settings.STORAGE_AVATAR_PREFIX or settings.S3_AVATAR_PREFIX
             if current_user.avatar_url.startswith(avatar_prefix):
                 try:
-                    delete_photo_from_s3(current_user.avatar_url)
+                    await run_in_threadpool(delete_photo_from_s3, current_user.avatar_url)
                 except Exception as e:
                     logger.warning(f"Failed to delete old avatar from S3: {str(e)}")
         
         # Upload new avatar to S3
-        s3_key = upload_avatar_to_s3(file_content, current_user.id, file_extension)
+        s3_key = await run_in_threadpool(upload_avatar_to_s3, file_content, current_user.id, file_extension)
         
         # Update user's avatar_url (store the S3 key, not the presigned URL)
         current_user.avatar_url = s3_key
-        db.commit()
-        db.refresh(current_user)
+        # Build the response before commit expires the instance (avoids a reload)
+        user_out = UserOut.from_user(current_user)
+        await run_in_threadpool(db.commit)
         
-        logger.info(f"User {current_user.id} updated avatar to {s3_key}")
+        logger.info(f"User {user_out.id} updated avatar to {s3_key}")
         
-        # Return user with stable image URL for immediate use
-        user_out = UserOut.model_validate(current_user)
         # Override avatar_url with stable image URL for response
         user_out.avatar_url = build_image_path(s3_key)
         return user_out
@@ -432,6 +453,7 @@ async def update_user_avatar(
 @router.put("/me/bio", response_model=UserOut)
 @rate_limit("10/minute")
 def update_user_bio(
+    request: Request,
     payload: UserBioUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -450,13 +472,13 @@ def update_user_bio(
         
         # Update bio
         current_user.bio = payload.bio
+        # Build the response before commit expires the instance (avoids a reload)
+        user_out = UserOut.from_user(current_user)
         db.commit()
-        db.refresh(current_user)
         
-        logger.info(f"User {current_user.id} updated bio")
+        logger.info(f"User {user_out.id} updated bio")
         
         # Return user with stable image URL for avatar if needed
-        user_out = UserOut.model_validate(current_user)
         if is_storage_key(user_out.avatar_url):
             user_out.avatar_url = build_image_path(user_out.avatar_url)
         
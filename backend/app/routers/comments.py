@@ -1,15 +1,17 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from datetime import datetime
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Response
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_, update
-from typing import List
+from sqlalchemy import func, or_, and_, select, text, update
+from typing import List, Optional, Tuple
 
 from app.core.deps import get_db, get_current_user
 from app.models.comment import Comment
 from app.models.post import Post
-from app.models.post_stats import PostStats
 from app.models.user import User
 from app.models.connection import Connection, ConnectionStatus
 from app.schemas.comment import CommentCreate, CommentOut
+from app.schemas.post import AuthorOut
+from app.services.connection_service import ConnectionService
 from app.services.notification_service import NotificationService
 
 router = APIRouter(prefix="/comments", tags=["Comments"])
@@ -17,20 +19,49 @@ router = APIRouter(prefix="/comments", tags=["Comments"])
 
 def are_connected(db: Session, user1_id: int, user2_id: int) -> bool:
     """Check if two users are connected (accepted connection)."""
-    # Normalize: ensure user_a_id < user_b_id
-    user_a_id = min(user1_id, user2_id)
-    user_b_id = max(user1_id, user2_id)
-    
-    connection = (
-        db.query(Connection)
-        .filter(
-            Connection.user_a_id == user_a_id,
-            Connection.user_b_id == user_b_id,
-            Connection.status == ConnectionStatus.ACCEPTED,
-        )
-        .first()
+    return ConnectionService.are_connected(user1_id, user2_id, db)
+
+
+def visible_to(user_id: int):
+    """
+    Filter for comments visible to a non-author viewer of a post: their own
+    comments plus those from users they have an accepted connection with.
+    (The caller verifies the viewer is connected to the post author.)
+    """
+    # One IN subquery per side of the normalized (user_a_id, user_b_id) pair,
+    # so each can use its (user_x_id, status) index
+    return or_(
+        Comment.author_id == user_id,
+        Comment.author_id.in_(
+            select(Connection.user_b_id).where(
+                Connection.user_a_id == user_id,
+                Connection.status == ConnectionStatus.ACCEPTED,
+            )
+        ),
+        Comment.author_id.in_(
+            select(Connection.user_a_id).where(
+                Connection.user_b_id == user_id,
+                Connection.status == ConnectionStatus.ACCEPTED,
+            )
+        ),
     )
-    return connection is not None
+
+
+def encode_comment_cursor(comment: Comment) -> str:
+    """Opaque keyset cursor "<created_at ISO>_<id>" for the page after this comment."""
+    return f"{comment.created_at.isoformat()}_{comment.id}"
+
+
+def decode_comment_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Parse a cursor from encode_comment_cursor."""
+    try:
+        created_at, _, comment_id = cursor.rpartition("_")
+        return datetime.fromisoformat(created_at), int(comment_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
 
 
 @router.post("/", response_model=CommentOut, status_code=status.HTTP_201_CREATED)
@@ -75,54 +106,62 @@ def create_comment(
     )
     db.add(new_comment)
     
-    # Update or create PostStats for this post
-    post_stats = db.query(PostStats).filter(PostStats.post_id == comment_data.post_id).first()
-    if not post_stats:
-        post_stats = PostStats(post_id=comment_data.post_id, comment_count=0)
-        db.add(post_stats)
-    
-    # Increment comment count
-    post_stats.comment_count = post_stats.comment_count + 1
+    # Increment comment count, creating PostStats if missing, in one atomic
+    # statement (no read-modify-write race between concurrent comments)
+    db.execute(
+        text("""
+            INSERT INTO post_stats (post_id, comment_count)
+            VALUES (:post_id, 1)
+            ON CONFLICT (post_id)
+            DO UPDATE SET comment_count = post_stats.comment_count + 1
+        """),
+        {"post_id": comment_data.post_id}
+    )
     
-    db.commit()
-    db.refresh(new_comment)
+    # The author is the current user; serialize it now rather than
+    # re-querying the comment with its author after commit
+    author = AuthorOut.model_validate(current_user)
     
-    # Create notification for post author
+    # Create notification for post author, in the same transaction
     NotificationService.create_comment_notification(
-        db, comment_data.post_id, current_user.id
+        db, comment_data.post_id, author.id, post_author_id=post.author_id
     )
     
-    # Load author relationship
-    new_comment = (
-        db.query(Comment)
-        .options(joinedload(Comment.author))
-        .filter(Comment.id == new_comment.id)
-        .first()
-    )
+    # One commit for the comment, the count bump and the notification
+    db.commit()
+    db.refresh(new_comment)
     
-    return CommentOut(
+    comment_out = CommentOut(
         id=new_comment.id,
         post_id=new_comment.post_id,
         author_id=new_comment.author_id,
         content=new_comment.content,
         created_at=new_comment.created_at,
-        author=new_comment.author
+        author=author
     )
+    
+    return comment_out
 
 
 @router.get("/posts/{post_id}", response_model=List[CommentOut])
 def get_post_comments(
     post_id: int,
+    response: Response,
+    after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Page size (all comments when omitted)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    Get all comments for a post with mutual connection filtering.
+    Get comments for a post with mutual connection filtering, oldest first.
     
     Visibility rules:
     - Post author can see all comments
     - Other users can only see comments from users they are mutually connected with
       (i.e., they must be connected to both the post author AND the comment author)
+    
+    Pass ``limit`` to page through the comments; when more remain, the
+    X-Next-Cursor response header holds the ``after`` value for the next page.
     """
     # Verify post exists
     post = db.query(Post).filter(Post.id == post_id).first()
@@ -140,40 +179,41 @@ def get_post_comments(
                 detail="You can only view comments on posts from your connections"
             )
     
-    # Get all comments for this post with author loaded
-    all_comments = (
+    # Get comments for this post with author loaded (only the AuthorOut columns)
+    query = (
         db.query(Comment)
-        .options(joinedload(Comment.author))
+        .options(
+            joinedload(Comment.author).load_only(
+                User.id, User.username, User.display_name, User.full_name
+            )
+        )
         .filter(Comment.post_id == post_id)
-        .order_by(Comment.created_at.asc())
-        .all()
     )
     
-    # Filter comments based on mutual connection rules
-    visible_comments = []
-    
-    # If user is post author, they can see all comments
-    is_post_author = (post.author_id == current_user.id)
-    
-    # Cache connection status to post author (we already verified user can see the post)
-    # So if not post author, they must be connected
-    is_connected_to_post_author = is_post_author or are_connected(db, current_user.id, post.author_id)
-    
-    for comment in all_comments:
-        # Post author can always see all comments
-        if is_post_author:
-            visible_comments.append(comment)
-        # Comment author can always see their own comment
-        elif comment.author_id == current_user.id:
-            visible_comments.append(comment)
-        else:
-            # For other users: can only see comment if they are connected to both
-            # the post author AND the comment author (mutual connection)
-            # We already know is_connected_to_post_author is true at this point
-            is_connected_to_comment_author = are_connected(db, current_user.id, comment.author_id)
-            
-            if is_connected_to_comment_author:
-                visible_comments.append(comment)
+    # Filter comments based on mutual connection rules, in SQL so a page is
+    # exactly `limit` visible comments. Post author can see all comments.
+    if post.author_id != current_user.id:
+        query = query.filter(visible_to(current_user.id))
+    
+    # Keyset pagination on (created_at, id), served by ix_comments_post_created_id
+    if after:
+        after_created_at, after_id = decode_comment_cursor(after)
+        # Spelled out rather than a row-value comparison so the bound timestamp
+        # takes the column's type (and storage format) on every dialect
+        query = query.filter(or_(
+            Comment.created_at > after_created_at,
+            and_(Comment.created_at == after_created_at, Comment.id > after_id),
+        ))
+    query = query.order_by(Comment.created_at.asc(), Comment.id.asc())
+    
+    if limit is None:
+        visible_comments = query.all()
+    else:
+        # Fetch one extra row to know whether another page exists
+        visible_comments = query.limit(limit + 1).all()
+        if len(visible_comments) > limit:
+            visible_comments = visible_comments[:limit]
+            response.headers["X-Next-Cursor"] = encode_comment_cursor(visible_comments[-1])
     
     # Get notification summary for comments
     comment_ids = [c.id for c in visible_comments]
@@ -223,31 +263,13 @@ def get_post_comment_count(
                 detail="You can only view comments on posts from your connections"
             )
     
-    # Get all comments for this post
-    all_comments = (
-        db.query(Comment)
-        .filter(Comment.post_id == post_id)
-        .all()
-    )
+    # Count visible comments based on mutual connection rules, entirely in SQL
+    query = db.query(func.count(Comment.id)).filter(Comment.post_id == post_id)
+    
+    # Post author can always see all comments
+    if post.author_id != current_user.id:
+        query = query.filter(visible_to(current_user.id))
     
-    # Count visible comments based on mutual connection rules
-    is_post_author = (post.author_id == current_user.id)
-    is_connected_to_post_author = is_post_author or are_connected(db, current_user.id, post.author_id)
-    
-    count = 0
-    for comment in all_comments:
-        # Post author can always see all comments
-        if is_post_author:
-            count += 1
-        # Comment author can always see their own comment
-        elif comment.author_id == current_user.id:
-            count += 1
-        else:
-            # For other users: can only see comment if they are connected to both
-            # the post author AND the comment author (mutual connection)
-            if is_connected_to_post_author:
-                is_connected_to_comment_author = are_connected(db, current_user.id, comment.author_id)
-                if is_connected_to_comment_author:
-                    count += 1
+    count = query.scalar()
     
     return {"count": count}
@@ -108,17 +108,17 @@ def add_tag_to_connection(
         )
     
     # Check if already tagged
-    existing = (
+    already_tagged = db.query(
         db.query(UserTag)
         .filter(
             UserTag.owner_user_id == current_user.id,
             UserTag.target_user_id == target_user_id,
             UserTag.tag_id == payload.tag_id,
         )
-        .first()
-    )
+        .exists()
+    ).scalar()
     
-    if existing:
+    if already_tagged:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="User already has this tag",
@@ -13,9 +13,9 @@ from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import or_, and_
 
 from app.core.deps import get_db, get_current_user
-from app.core.image_urls import build_image_path
+from app.core.image_urls import build_image_paths
 from app.core.llm import generate_weekly_summary
-from app.core.metrics import digest_requests_total, digest_latency_seconds
+from app.core.metrics import inc_digest_request, observe_digest_latency
 from app.config import settings
 from app.models.user import User
 from app.models.post import Post
@@ -187,7 +187,7 @@ def get_digest(
         }
     """
     # Track metrics
-    digest_requests_total.inc()
+    inc_digest_request()
     start_time = time.time()
     
     try:
@@ -315,7 +315,7 @@ def get_digest(
         posts_with_scores = []  # For weekly summary generation
         
         for post in digest_filtered_posts:
-            photo_urls_presigned = [build_image_path(key) for key in (post.photo_urls or [])]
+            photo_urls_presigned = build_image_paths(post.photo_urls)
             
             # Create PostOut
             post_dict = {
@@ -353,4 +353,4 @@ def get_digest(
     finally:
         # Record latency
         duration = time.time() - start_time
-        digest_latency_seconds.observe(duration)
+        observe_digest_latency(duration)
@@ -5,8 +5,8 @@ from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import select, union_all, or_, and_
 
 from app.core.deps import get_db, get_current_user
-from app.core.image_urls import build_image_path
-from app.core.metrics import feed_requests_total, feed_latency_seconds
+from app.core.image_urls import build_image_paths
+from app.core.metrics import inc_feed_request, observe_feed_latency
 from app.models.user import User
 from app.models.post import Post
 from app.models.post_stats import PostStats
@@ -37,7 +37,7 @@ def get_feed(
     Optionally filter by tags.
     """
     # Track metrics
-    feed_requests_total.inc()
+    inc_feed_request()
     start_time = time.time()
     
     try:
@@ -137,13 +137,18 @@ def get_feed(
         post_ids = [post.id for post in filtered_posts]
         post_stats_map = {}
         if post_ids:
-            stats = db.query(PostStats).filter(PostStats.post_id.in_(post_ids)).all()
-            post_stats_map = {stat.post_id: stat.comment_count for stat in stats}
+            # Only the count is needed; fetch plain rows instead of PostStats instances
+            stats = (
+                db.query(PostStats.post_id, PostStats.comment_count)
+                .filter(PostStats.post_id.in_(post_ids))
+                .all()
+            )
+            post_stats_map = dict(stats)
         
         # Convert posts to PostOut with pre-signed URLs for photos
         result = []
         for post in filtered_posts:
-            photo_urls_presigned = [build_image_path(key) for key in (post.photo_urls or [])]
+            photo_urls_presigned = build_image_paths(post.photo_urls)
             
             # Get comment count from PostStats (default to 0 if not found)
             comment_count = post_stats_map.get(post.id, 0)
@@ -167,4 +172,4 @@ def get_feed(
     finally:
         # Record latency
         duration = time.time() - start_time
-        feed_latency_seconds.observe(duration)
+        observe_feed_latency(duration)
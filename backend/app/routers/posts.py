@@ -6,8 +6,8 @@ from typing import List, Optional
 from datetime import datetime, timezone
 
 from app.core.deps import get_db, get_current_user
-from app.core.image_urls import build_image_path
-from app.core.s3 import validate_image, upload_photo_to_s3, generate_presigned_url, delete_photo_from_s3
+from app.core.image_urls import build_image_paths
+from app.core.s3 import IMAGE_FORMAT_EXTENSIONS, validate_image, upload_photo_to_s3, generate_presigned_url, delete_photos_from_s3
 from app.models.post import Post
 from app.models.post_audience_tag import PostAudienceTag
 from app.models.post_stats import PostStats
@@ -23,7 +23,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.post("/", response_model=PostOut, status_code=status.HTTP_201_CREATED)
-async def create_post(
+def create_post(
     content: str = Form(...),
     audience_type: str = Form("all"),
     audience_tag_ids: Optional[str] = Form(None),  # Comma-separated string
@@ -71,8 +71,6 @@ async def create_post(
                 post_timestamp = datetime.fromisoformat(client_timestamp)
         except (ValueError, AttributeError) as e:
             # If parsing fails, fall back to server time
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"Failed to parse client_timestamp '{client_timestamp}': {e}. Using server time.")
             post_timestamp = datetime.now()
     else:
@@ -145,8 +143,9 @@ async def create_post(
         # Process each photo
         for photo in photos:
             try:
-                # Read file content
-                file_content = await photo.read()
+                # Validate and upload straight from the spooled upload file;
+                # no copy of the payload is made in Python memory
+                file_content = photo.file
                 
                 # Validate image
                 is_valid, error_msg, image_info = validate_image(file_content, max_size_mb=0.2)
@@ -159,18 +158,9 @@ async def create_post(
                         detail=f"Photo validation failed: {error_msg}"
                     )
                 
-                # Determine file extension from content type or filename
-                file_extension = "jpg"  # default
-                if photo.filename:
-                    if photo.filename.lower().endswith(('.png',)):
-                        file_extension = "png"
-                    elif photo.filename.lower().endswith(('.webp',)):
-                        file_extension = "webp"
-                    elif photo.filename.lower().endswith(('.jpg', '.jpeg')):
-                        file_extension = "jpg"
-                elif image_info and image_info.get('format'):
-                    format_map = {'JPEG': 'jpg', 'PNG': 'png', 'WEBP': 'webp'}
-                    file_extension = format_map.get(image_info['format'], 'jpg')
+                # Name the object after the format validate_image detected from
+                # the bytes; the client-supplied filename can't be trusted
+                file_extension = IMAGE_FORMAT_EXTENSIONS[image_info['format']]
                 
                 # Upload to S3
                 s3_key = upload_photo_to_s3(
@@ -236,7 +226,7 @@ async def create_post(
         db.commit()
         db.refresh(new_post)
 
-    photo_urls_presigned = [build_image_path(key) for key in (new_post.photo_urls or [])]
+    photo_urls_presigned = build_image_paths(new_post.photo_urls)
     
     # Use PostService to batch load audience tags
     audience_tags_map = PostService.batch_load_audience_tags([new_post], db)
@@ -281,13 +271,18 @@ def get_my_posts(
     post_ids = [post.id for post in posts]
     post_stats_map = {}
     if post_ids:
-        stats = db.query(PostStats).filter(PostStats.post_id.in_(post_ids)).all()
-        post_stats_map = {stat.post_id: stat.comment_count for stat in stats}
+        # Only the count is needed; fetch plain rows instead of PostStats instances
+        stats = (
+            db.query(PostStats.post_id, PostStats.comment_count)
+            .filter(PostStats.post_id.in_(post_ids))
+            .all()
+        )
+        post_stats_map = dict(stats)
     
     # Convert to PostOut with stable image URLs
     result = []
     for post in posts:
-        photo_urls_presigned = [build_image_path(key) for key in (post.photo_urls or [])]
+        photo_urls_presigned = build_image_paths(post.photo_urls)
         
         comment_count = post_stats_map.get(post.id, 0)
         
@@ -338,13 +333,18 @@ def get_user_posts(
     post_ids = [post.id for post in posts]
     post_stats_map = {}
     if post_ids:
-        stats = db.query(PostStats).filter(PostStats.post_id.in_(post_ids)).all()
-        post_stats_map = {stat.post_id: stat.comment_count for stat in stats}
+        # Only the count is needed; fetch plain rows instead of PostStats instances
+        stats = (
+            db.query(PostStats.post_id, PostStats.comment_count)
+            .filter(PostStats.post_id.in_(post_ids))
+            .all()
+        )
+        post_stats_map = dict(stats)
     
     # Convert to PostOut with stable image URLs
     result = []
     for post in posts:
-        photo_urls_presigned = [build_image_path(key) for key in (post.photo_urls or [])]
+        photo_urls_presigned = build_image_paths(post.photo_urls)
         
         comment_count = post_stats_map.get(post.id, 0)
         
@@ -399,16 +399,13 @@ def delete_post(
         db.query(PostAudienceTag).filter(PostAudienceTag.post_id == post_id).delete()
         db.commit()
         
-        # Step 2: Delete photos from S3 (if any)
+        # Step 2: Delete photos from S3 (if any), all in one request
         if post.photo_urls:
-            for s3_key in post.photo_urls:
-                try:
-                    delete_photo_from_s3(s3_key)
-                except Exception as e:
-                    # Log error but continue deletion (don't fail if S3 delete fails)
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.error(f"Failed to delete photo from S3 ({s3_key}): {str(e)}")
+            try:
+                delete_photos_from_s3(post.photo_urls)
+            except Exception as e:
+                # Log error but continue deletion (don't fail if S3 delete fails)
+                logger.error(f"Failed to delete photos from S3 ({post.photo_urls}): {str(e)}")
         
         # Step 3: Delete the post itself
         db.delete(post)
@@ -418,8 +415,6 @@ def delete_post(
         
     except Exception as e:
         db.rollback()
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error deleting post {post_id}: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -446,12 +441,14 @@ def report_post(
         )
     
     # Check if user has already reported this post
-    existing_report = db.query(ReportedPost).filter(
-        ReportedPost.post_id == post_id,
-        ReportedPost.reported_by_id == current_user.id
-    ).first()
+    already_reported = db.query(
+        db.query(ReportedPost).filter(
+            ReportedPost.post_id == post_id,
+            ReportedPost.reported_by_id == current_user.id
+        ).exists()
+    ).scalar()
     
-    if existing_report:
+    if already_reported:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You have already reported this post"
@@ -8,7 +8,6 @@ from app.core.deps import get_db, get_current_user
 from app.models.reaction import Reaction
 from app.models.post import Post
 from app.models.user import User
-from app.models.connection import Connection, ConnectionStatus
 from app.schemas.reaction import (
     ReactionCreate,
     ReactionOut,
@@ -17,25 +16,14 @@ from app.schemas.reaction import (
     EmojiReactorsOut,
     ReactorOut
 )
+from app.services.connection_service import ConnectionService
 
 router = APIRouter(prefix="/reactions", tags=["Reactions"])
 
 
 def are_connected(db: Session, user1_id: int, user2_id: int) -> bool:
     """Check if two users are connected (accepted connection)."""
-    user_a_id = min(user1_id, user2_id)
-    user_b_id = max(user1_id, user2_id)
-    
-    connection = (
-        db.query(Connection)
-        .filter(
-            Connection.user_a_id == user_a_id,
-            Connection.user_b_id == user_b_id,
-            Connection.status == ConnectionStatus.ACCEPTED,
-        )
-        .first()
-    )
-    return connection is not None
+    return ConnectionService.are_connected(user1_id, user2_id, db)
 
 
 @router.post("/posts/{post_id}", response_model=ReactionOut, status_code=status.HTTP_201_CREATED)
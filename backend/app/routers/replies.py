@@ -8,8 +8,8 @@ from app.models.reply import Reply
 from app.models.comment import Comment
 from app.models.post import Post
 from app.models.user import User
-from app.models.connection import Connection, ConnectionStatus
 from app.schemas.reply import ReplyCreate, ReplyOut
+from app.services.connection_service import ConnectionService
 from app.services.notification_service import NotificationService
 
 router = APIRouter(prefix="/replies", tags=["Replies"])
@@ -17,20 +17,7 @@ router = APIRouter(prefix="/replies", tags=["Replies"])
 
 def are_connected(db: Session, user1_id: int, user2_id: int) -> bool:
     """Check if two users are connected (accepted connection)."""
-    # Normalize: ensure user_a_id < user_b_id
-    user_a_id = min(user1_id, user2_id)
-    user_b_id = max(user1_id, user2_id)
-    
-    connection = (
-        db.query(Connection)
-        .filter(
-            Connection.user_a_id == user_a_id,
-            Connection.user_b_id == user_b_id,
-            Connection.status == ConnectionStatus.ACCEPTED,
-        )
-        .first()
-    )
-    return connection is not None
+    return ConnectionService.are_connected(user1_id, user2_id, db)
 
 
 @router.post("/", response_model=ReplyOut, status_code=status.HTTP_201_CREATED)
@@ -49,13 +49,13 @@ def create_tag(
 ):
     """Create a new tag"""
     # Check if tag name already exists for this user
-    existing = (
+    name_taken = db.query(
         db.query(Tag)
         .filter(Tag.owner_user_id == current_user.id, Tag.name == payload.name)
-        .first()
-    )
+        .exists()
+    ).scalar()
     
-    if existing:
+    if name_taken:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Tag '{payload.name}' already exists",
@@ -92,16 +92,16 @@ def update_tag(
     
     if payload.name:
         # Check for duplicate name
-        existing = (
+        name_taken = db.query(
             db.query(Tag)
             .filter(
                 Tag.owner_user_id == current_user.id,
                 Tag.name == payload.name,
                 Tag.id != tag_id,
             )
-            .first()
-        )
-        if existing:
+            .exists()
+        ).scalar()
+        if name_taken:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Tag '{payload.name}' already exists",
@@ -16,6 +16,9 @@ class UserCreate(UserBase):
 
 
 class UserOut(UserBase):
+    # Emails are validated on the way in; re-parsing them on every response
+    # (and again in FastAPI's response_model check) is pure overhead
+    email: str
     id: int
     google_id: str
     auth_provider: str
@@ -29,6 +32,11 @@ class UserOut(UserBase):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_user(cls, user) -> "UserOut":
+        """Build from a loaded User row without re-running field validation."""
+        return cls.model_construct(**{name: getattr(user, name) for name in cls.model_fields})
+
 
 class UserBioUpdate(BaseModel):
     bio: Optional[str] = None
@@ -1,10 +1,35 @@
 """Connection service for centralized connection business logic."""
+from itertools import chain
 from typing import List, Set
 from sqlalchemy.orm import Session
-from sqlalchemy import case, or_
+from sqlalchemy import bindparam, case, event, exists, or_, select
 from app.models.connection import Connection, ConnectionStatus
 from app.models.user import User
 
+# Session.info key for the per-session are_connected memo
+_CONNECTED_MEMO_KEY = "connected_pairs"
+
+# Built once: the statement is reused with new parameters on every call
+# instead of rebuilding the query and recomputing its cache key.
+# EXISTS probe on the unique (user_a_id, user_b_id) index; no row hydration.
+_ARE_CONNECTED = select(
+    exists().where(
+        Connection.user_a_id == bindparam("user_a_id"),
+        Connection.user_b_id == bindparam("user_b_id"),
+        Connection.status == ConnectionStatus.ACCEPTED,
+    )
+)
+
+
+@event.listens_for(Session, "before_flush")
+def _clear_connected_memo(session, flush_context, instances):
+    """Drop memoized answers once connections change in this session."""
+    if _CONNECTED_MEMO_KEY in session.info and any(
+        isinstance(obj, Connection)
+        for obj in chain(session.new, session.dirty, session.deleted)
+    ):
+        del session.info[_CONNECTED_MEMO_KEY]
+
 
 class ConnectionService:
     """Centralized connection business logic."""
@@ -49,21 +74,21 @@ class ConnectionService:
         user2_id: int,
         db: Session
     ) -> bool:
-        """Check if two users are connected."""
-        user_a_id = min(user1_id, user2_id)
-        user_b_id = max(user1_id, user2_id)
-        
-        connection = (
-            db.query(Connection)
-            .filter(
-                Connection.user_a_id == user_a_id,
-                Connection.user_b_id == user_b_id,
-                Connection.status == ConnectionStatus.ACCEPTED
-            )
-            .first()
-        )
+        """
+        Check if two users are connected.
+        Answers are memoized on the session, so repeated checks within one
+        request (e.g. the same author across many comments) hit the DB once.
+        """
+        pair = (min(user1_id, user2_id), max(user1_id, user2_id))
+        memo = db.info.setdefault(_CONNECTED_MEMO_KEY, {})
+        connected = memo.get(pair)
+        if connected is None:
+            connected = db.execute(
+                _ARE_CONNECTED, {"user_a_id": pair[0], "user_b_id": pair[1]}
+            ).scalar()
+            memo[pair] = connected
         
-        return connection is not None
+        return connected
     
     @staticmethod
     def build_connection_graph(
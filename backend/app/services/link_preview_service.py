@@ -10,6 +10,22 @@ from urllib.parse import urlparse, parse_qs
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import instead of looked up per call
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_OG_TAG_RES = {
+    field: re.compile(
+        rf'<meta\s+property=["\']og:{prop}["\']\s+content=["\']([^"\']+)["\']',
+        re.IGNORECASE,
+    )
+    for field, prop in (
+        ('title', 'title'),
+        ('description', 'description'),
+        ('thumbnail_url', 'image'),
+        ('type', 'type'),
+    )
+}
+_TITLE_TAG_RE = re.compile(r'<title>([^<]+)</title>', re.IGNORECASE)
+
 
 class LinkPreviewService:
     """Service for fetching link previews from various platforms."""
@@ -22,10 +38,7 @@ class LinkPreviewService:
     @staticmethod
     def extract_urls(text: str) -> list[str]:
         """Extract URLs from text content."""
-        # Regex pattern to match URLs
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        urls = re.findall(url_pattern, text)
-        return urls
+        return _URL_RE.findall(text)
     
     @staticmethod
     def is_music_platform_url(url: str) -> bool:
@@ -215,29 +228,15 @@ class LinkPreviewService:
             # Simple regex-based parsing (could be improved with BeautifulSoup)
             og_data = {}
             
-            # Extract og:title
-            title_match = re.search(r'<meta\s+property=["\']og:title["\']\s+content=["\']([^"\']+)["\']', html, re.IGNORECASE)
-            if title_match:
-                og_data['title'] = title_match.group(1)
-            
-            # Extract og:description
-            desc_match = re.search(r'<meta\s+property=["\']og:description["\']\s+content=["\']([^"\']+)["\']', html, re.IGNORECASE)
-            if desc_match:
-                og_data['description'] = desc_match.group(1)
-            
-            # Extract og:image
-            image_match = re.search(r'<meta\s+property=["\']og:image["\']\s+content=["\']([^"\']+)["\']', html, re.IGNORECASE)
-            if image_match:
-                og_data['thumbnail_url'] = image_match.group(1)
-            
-            # Extract og:type
-            type_match = re.search(r'<meta\s+property=["\']og:type["\']\s+content=["\']([^"\']+)["\']', html, re.IGNORECASE)
-            if type_match:
-                og_data['type'] = type_match.group(1)
+            # Extract og:title, og:description, og:image and og:type
+            for field, pattern in _OG_TAG_RES.items():
+                match = pattern.search(html)
+                if match:
+                    og_data[field] = match.group(1)
             
             # Fallback to title tag if og:title not found
             if 'title' not in og_data:
-                title_tag_match = re.search(r'<title>([^<]+)</title>', html, re.IGNORECASE)
+                title_tag_match = _TITLE_TAG_RE.search(html)
                 if title_tag_match:
                     og_data['title'] = title_tag_match.group(1).strip()
             
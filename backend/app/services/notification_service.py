@@ -20,23 +20,28 @@ class NotificationService:
         db: Session,
         post_id: int,
         comment_author_id: int,
+        post_author_id: Optional[int] = None,
     ) -> Optional[Notification]:
         """
         Create a notification when someone comments on a post.
         Notifies the post author (unless they commented on their own post).
+        
+        Does not commit: the caller commits it together with the comment.
+        Pass post_author_id when the post is already loaded to skip the lookup.
         """
-        # Get post to find author
-        post = db.query(Post).filter(Post.id == post_id).first()
-        if not post:
-            return None
+        if post_author_id is None:
+            # Get post to find author
+            post_author_id = db.query(Post.author_id).filter(Post.id == post_id).scalar()
+            if post_author_id is None:
+                return None
         
         # Don't notify if commenter is the post author
-        if post.author_id == comment_author_id:
+        if post_author_id == comment_author_id:
             return None
         
         # Check if notification already exists (avoid duplicates)
         existing = db.query(Notification).filter(
-            Notification.recipient_id == post.author_id,
+            Notification.recipient_id == post_author_id,
             Notification.post_id == post_id,
             Notification.type == 'comment',
             Notification.read_at.is_(None)
@@ -46,12 +51,11 @@ class NotificationService:
             # Update actor to latest commenter
             existing.actor_id = comment_author_id
             existing.created_at = datetime.now(timezone.utc)
-            db.commit()
             return existing
         
         # Create new notification
         notification = Notification(
-            recipient_id=post.author_id,
+            recipient_id=post_author_id,
             actor_id=comment_author_id,
             post_id=post_id,
             comment_id=None,
@@ -59,8 +63,6 @@ class NotificationService:
             created_at=datetime.now(timezone.utc)
         )
         db.add(notification)
-        db.commit()
-        db.refresh(notification)
         return notification
     
     @staticmethod
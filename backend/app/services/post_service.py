@@ -97,14 +97,14 @@ class PostService:
         audience_tags_map = {}
         if post_ids:
             associations = (
-                db.query(PostAudienceTag)
+                db.query(PostAudienceTag.post_id, PostAudienceTag.tag_id)
                 .filter(PostAudienceTag.post_id.in_(post_ids))
                 .all()
             )
-            for assoc in associations:
-                if assoc.post_id not in audience_tags_map:
-                    audience_tags_map[assoc.post_id] = []
-                audience_tags_map[assoc.post_id].append(assoc.tag_id)
+            for post_id, tag_id in associations:
+                if post_id not in audience_tags_map:
+                    audience_tags_map[post_id] = []
+                audience_tags_map[post_id].append(tag_id)
         
         # Query 2: Get all tags
         all_tag_ids = set()
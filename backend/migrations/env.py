@@ -12,17 +12,8 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from app.db import Base
 from app.config import settings
 
-# Import ALL models so metadata picks them up
-from app.models.user import User  # noqa
-from app.models.connection import Connection  # noqa
-from app.models.post import Post  # noqa
-from app.models.tag import Tag  # noqa
-from app.models.user_tag import UserTag  # noqa
-from app.models.post_audience_tag import PostAudienceTag  # noqa
-from app.models.comment import Comment  # noqa
-from app.models.reply import Reply  # noqa
-from app.models.reaction import Reaction  # noqa
-from app.models.post_stats import PostStats  # noqa
+# Import ALL models so metadata picks them up (the package registers every model)
+import app.models  # noqa
 
 # Alembic Config object
 config = context.config
@@ -0,0 +1,44 @@
+"""Add (parent, created_at) indexes for comment and reply listings
+
+Revision ID: add_comment_reply_created_idx
+Revises: merge_reactions_post_stats
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_comment_reply_created_idx'
+down_revision: Union[str, Sequence[str], None] = 'merge_reactions_post_stats'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite indexes so comment/reply listings are index-ordered scans."""
+    # CONCURRENTLY can't run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_comments_post_created',
+            'comments',
+            ['post_id', 'created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_replies_comment_created',
+            'replies',
+            ['comment_id', 'created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Remove composite indexes."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_replies_comment_created', table_name='replies', postgresql_concurrently=True)
+        op.drop_index('ix_comments_post_created', table_name='comments', postgresql_concurrently=True)
@@ -0,0 +1,37 @@
+"""Add partial index for unverified email OTP lookups
+
+Revision ID: email_verif_active_idx
+Revises: connection_status_composite_idx
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'email_verif_active_idx'
+down_revision: Union[str, Sequence[str], None] = 'connection_status_composite_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index (email, otp_code) for OTPs that have not been verified yet."""
+    # CONCURRENTLY can't run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_email_verif_active',
+            'email_verifications',
+            ['email', 'otp_code'],
+            postgresql_where=sa.text('verified_at IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Remove the partial index."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_email_verif_active', table_name='email_verifications', postgresql_concurrently=True)
@@ -0,0 +1,39 @@
+"""Extend the comments (post_id, created_at) index with id for keyset pagination
+
+Revision ID: comments_post_created_id_idx
+Revises: server_default_created_at_tags
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'comments_post_created_id_idx'
+down_revision: Union[str, Sequence[str], None] = 'server_default_created_at_tags'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace ix_comments_post_created with (post_id, created_at, id)."""
+    # CONCURRENTLY can't run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_comments_post_created_id',
+            'comments',
+            ['post_id', 'created_at', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Every query the old index served is a prefix of the new one
+        op.drop_index('ix_comments_post_created', table_name='comments', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the (post_id, created_at) index."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_comments_post_created', 'comments', ['post_id', 'created_at'], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_comments_post_created_id', table_name='comments', postgresql_concurrently=True)
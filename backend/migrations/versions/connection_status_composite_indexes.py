@@ -0,0 +1,50 @@
+"""Replace single-column connection indexes with (user, status) composites
+
+Revision ID: connection_status_composite_idx
+Revises: server_default_created_at
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'connection_status_composite_idx'
+down_revision: Union[str, Sequence[str], None] = 'server_default_created_at'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index each side of a connection together with its status."""
+    # CONCURRENTLY can't run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_conn_user_a_status',
+            'connections',
+            ['user_a_id', 'status'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_conn_user_b_status',
+            'connections',
+            ['user_b_id', 'status'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Covered by the composites' leading column / too low-cardinality to use
+        for name in ('idx_user_a', 'idx_user_b', 'idx_status'):
+            op.drop_index(name, table_name='connections', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_status', 'connections', ['status'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_user_b', 'connections', ['user_b_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_user_a', 'connections', ['user_a_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_conn_user_b_status', table_name='connections', postgresql_concurrently=True)
+        op.drop_index('ix_conn_user_a_status', table_name='connections', postgresql_concurrently=True)
@@ -0,0 +1,41 @@
+"""Store email verification OTP codes as integers
+
+Revision ID: otp_code_integer
+Revises: photo_urls_text_array
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'otp_code_integer'
+down_revision: Union[str, Sequence[str], None] = 'photo_urls_text_array'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert otp_code from VARCHAR(6) to INTEGER."""
+    op.alter_column(
+        'email_verifications',
+        'otp_code',
+        type_=sa.Integer(),
+        existing_type=sa.String(6),
+        existing_nullable=False,
+        postgresql_using='otp_code::integer',
+    )
+
+
+def downgrade() -> None:
+    """Convert otp_code back to zero-padded VARCHAR(6)."""
+    op.alter_column(
+        'email_verifications',
+        'otp_code',
+        type_=sa.String(6),
+        existing_type=sa.Integer(),
+        existing_nullable=False,
+        postgresql_using="lpad(otp_code::text, 6, '0')",
+    )
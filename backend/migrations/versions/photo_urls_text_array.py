@@ -0,0 +1,44 @@
+"""Store posts.photo_urls as a native text array
+
+Revision ID: photo_urls_text_array
+Revises: email_verif_active_idx
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'photo_urls_text_array'
+down_revision: Union[str, Sequence[str], None] = 'email_verif_active_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert photo_urls from JSON to text[]."""
+    # ALTER ... USING can't take a subquery, so copy through a new column
+    op.add_column(
+        'posts',
+        sa.Column('photo_urls_arr', postgresql.ARRAY(sa.Text()), server_default='{}', nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE posts
+        SET photo_urls_arr = ARRAY(SELECT json_array_elements_text(photo_urls))
+        WHERE photo_urls IS NOT NULL AND json_typeof(photo_urls) = 'array'
+        """
+    )
+    op.drop_column('posts', 'photo_urls')
+    op.alter_column('posts', 'photo_urls_arr', new_column_name='photo_urls')
+
+
+def downgrade() -> None:
+    """Convert photo_urls back to JSON."""
+    op.add_column('posts', sa.Column('photo_urls_json', sa.JSON(), nullable=True))
+    op.execute("UPDATE posts SET photo_urls_json = to_json(photo_urls)")
+    op.drop_column('posts', 'photo_urls')
+    op.alter_column('posts', 'photo_urls_json', new_column_name='photo_urls')
@@ -0,0 +1,43 @@
+"""Default created_at timestamps on the database side
+
+Revision ID: server_default_created_at
+Revises: add_comment_reply_created_idx
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'server_default_created_at'
+down_revision: Union[str, Sequence[str], None] = 'add_comment_reply_created_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs whose value the models now leave to the database
+TIMESTAMP_COLUMNS = [
+    ('comments', 'created_at'),
+    ('replies', 'created_at'),
+    ('connections', 'created_at'),
+    ('connections', 'updated_at'),
+    ('email_verifications', 'created_at'),
+    ('notifications', 'created_at'),
+    ('reactions', 'created_at'),
+    ('registration_requests', 'created_at'),
+    ('users', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    """Set UTC now() server defaults (metadata-only change, no table rewrite)."""
+    # Columns are timestamp without time zone holding UTC, as before
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)"))
+
+
+def downgrade() -> None:
+    """Remove server defaults."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
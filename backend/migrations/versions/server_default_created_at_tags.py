@@ -0,0 +1,37 @@
+"""Default tag and report created_at timestamps on the database side
+
+Revision ID: server_default_created_at_tags
+Revises: user_tags_covering_idx
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'server_default_created_at_tags'
+down_revision: Union[str, Sequence[str], None] = 'user_tags_covering_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs whose value the models now leave to the database
+TIMESTAMP_COLUMNS = [
+    ('user_tags', 'created_at'),
+    ('tags', 'created_at'),
+    ('reported_posts', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    """Set UTC now() server defaults (metadata-only change, no table rewrite)."""
+    # Columns are timestamp without time zone holding UTC, as before
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)"))
+
+
+def downgrade() -> None:
+    """Remove server defaults."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
@@ -0,0 +1,39 @@
+"""Replace user_tags owner index with an (owner, tag, target) covering index
+
+Revision ID: user_tags_covering_idx
+Revises: otp_code_integer
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'user_tags_covering_idx'
+down_revision: Union[str, Sequence[str], None] = 'otp_code_integer'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add covering index for tag-filtered lookups and drop the redundant owner index."""
+    # CONCURRENTLY can't run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_tags_owner_tag_target',
+            'user_tags',
+            ['owner_user_id', 'tag_id', 'target_user_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # unique_user_tag_assignment already leads with owner_user_id
+        op.drop_index('idx_owner_user', table_name='user_tags', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the single-column owner index."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_owner_user', 'user_tags', ['owner_user_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_user_tags_owner_tag_target', table_name='user_tags', postgresql_concurrently=True)
@@ -0,0 +1,249 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.core.security import create_access_token
+from app.models.comment import Comment
+from app.models.connection import Connection, ConnectionStatus
+from app.models.notification import Notification
+from app.models.post import Post
+from app.models.post_stats import PostStats
+from app.models.user import User
+
+
+def _make_user(db, name):
+    user = User(email=f"{name}@example.com", username=name, google_id=f"g-{name}")
+    db.add(user)
+    db.flush()
+    return user
+
+
+def _make_post(db, author, comment_authors=()):
+    post = Post(author_id=author.id, content="post", created_at=datetime(2026, 1, 1))
+    db.add(post)
+    db.flush()
+    db.add(PostStats(post_id=post.id, comment_count=len(comment_authors)))
+    for commenter in comment_authors:
+        db.add(Comment(post_id=post.id, author_id=commenter.id, content="comment"))
+    db.commit()
+    return post
+
+
+@pytest.fixture
+def post_stats_updates(db_session):
+    """Collect every UPDATE issued against post_stats."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE POST_STATS"):
+            statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def test_deleting_comments_decrements_once_per_post(db_session, post_stats_updates):
+    author = _make_user(db_session, "author")
+    post = _make_post(db_session, author, [author, author, author])
+
+    for comment in db_session.query(Comment).limit(2).all():
+        db_session.delete(comment)
+    db_session.commit()
+
+    assert len(post_stats_updates) == 1
+    assert db_session.get(PostStats, post.id).comment_count == 1
+
+
+def test_deleting_post_skips_comment_count_update(db_session, post_stats_updates):
+    author = _make_user(db_session, "author")
+    post = _make_post(db_session, author, [author, author])
+
+    db_session.delete(post)
+    db_session.commit()
+
+    # The stats row is cascade-deleted; no comment_count UPDATE is issued
+    assert post_stats_updates == []
+    assert db_session.query(PostStats).count() == 0
+    assert db_session.query(Comment).count() == 0
+
+
+def _connect(db, user1, user2):
+    db.add(Connection(
+        user_a_id=min(user1.id, user2.id),
+        user_b_id=max(user1.id, user2.id),
+        initiated_by_user_id=user1.id,
+        status=ConnectionStatus.ACCEPTED,
+    ))
+
+
+def _headers(user_id):
+    return {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+
+@pytest.fixture
+def visibility_post(db_session):
+    """
+    Post by `author` with comments from the author, a mutual connection of the
+    viewer, a commenter connected only to the author, and the viewer.
+    Returns (post_id, user ids by role).
+    """
+    author = _make_user(db_session, "author")
+    viewer = _make_user(db_session, "viewer")
+    mutual = _make_user(db_session, "mutual")
+    stranger = _make_user(db_session, "stranger")  # Connected to author, not viewer
+    outsider = _make_user(db_session, "outsider")  # Not connected to author
+    _connect(db_session, author, viewer)
+    _connect(db_session, author, mutual)
+    _connect(db_session, author, stranger)
+    _connect(db_session, viewer, mutual)
+    post = _make_post(db_session, author, [author, mutual, stranger, viewer])
+    ids = {u.username: u.id for u in (author, viewer, mutual, stranger, outsider)}
+    return post.id, ids
+
+
+def test_post_author_sees_all_comments(client, visibility_post):
+    post_id, ids = visibility_post
+    response = client.get(f"/comments/posts/{post_id}", headers=_headers(ids["author"]))
+    assert response.status_code == 200
+    assert [c["author_id"] for c in response.json()] == [
+        ids["author"], ids["mutual"], ids["stranger"], ids["viewer"]
+    ]
+
+
+def test_connection_sees_only_mutually_connected_comments(client, visibility_post):
+    post_id, ids = visibility_post
+    response = client.get(f"/comments/posts/{post_id}", headers=_headers(ids["viewer"]))
+    assert response.status_code == 200
+    # The stranger's comment is hidden: viewer isn't connected to them
+    assert [c["author_id"] for c in response.json()] == [
+        ids["author"], ids["mutual"], ids["viewer"]
+    ]
+
+
+def test_non_connection_cannot_view_comments(client, visibility_post):
+    post_id, ids = visibility_post
+    response = client.get(f"/comments/posts/{post_id}", headers=_headers(ids["outsider"]))
+    assert response.status_code == 403
+
+
+def test_comment_count_matches_visibility(client, visibility_post):
+    post_id, ids = visibility_post
+    counts = {
+        role: client.get(f"/comments/posts/{post_id}/count", headers=_headers(ids[role]))
+        for role in ("author", "viewer", "outsider")
+    }
+    assert counts["author"].json() == {"count": 4}
+    # The stranger's comment is not counted for the viewer
+    assert counts["viewer"].json() == {"count": 3}
+    assert counts["outsider"].status_code == 403
+
+
+def _page_through(client, post_id, headers, limit):
+    pages, after = [], None
+    while True:
+        params = {"limit": limit, **({"after": after} if after else {})}
+        response = client.get(f"/comments/posts/{post_id}", params=params, headers=headers)
+        assert response.status_code == 200
+        pages.append([c["id"] for c in response.json()])
+        after = response.headers.get("X-Next-Cursor")
+        if after is None:
+            return pages
+
+
+def test_comment_pages_with_server_default_timestamps(client, db_session):
+    author = _make_user(db_session, "author")
+    # created_at comes from the server default, so several share a timestamp
+    post = _make_post(db_session, author, [author] * 4)
+    ids = [c.id for c in db_session.query(Comment).order_by(Comment.id)]
+
+    pages = _page_through(client, post.id, _headers(author.id), limit=2)
+
+    # The last page is full but carries no cursor
+    assert pages == [ids[:2], ids[2:]]
+
+
+def test_comment_pages_break_created_at_ties_by_id(client, db_session):
+    author = _make_user(db_session, "author")
+    post = _make_post(db_session, author)
+    tied = datetime(2026, 1, 1, 12, 0, 0)
+    for _ in range(5):
+        db_session.add(Comment(post_id=post.id, author_id=author.id, content="c", created_at=tied))
+    db_session.commit()
+    ids = [c.id for c in db_session.query(Comment).order_by(Comment.id)]
+
+    pages = _page_through(client, post.id, _headers(author.id), limit=2)
+
+    assert pages == [ids[:2], ids[2:4], ids[4:]]
+
+
+def test_comment_page_without_limit_returns_everything(client, db_session):
+    author = _make_user(db_session, "author")
+    post = _make_post(db_session, author, [author] * 3)
+    response = client.get(f"/comments/posts/{post.id}", headers=_headers(author.id))
+    assert len(response.json()) == 3
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_comment_page_rejects_bad_cursor(client, db_session):
+    author = _make_user(db_session, "author")
+    post = _make_post(db_session, author, [author])
+    response = client.get(
+        f"/comments/posts/{post.id}",
+        params={"limit": 2, "after": "not-a-cursor"},
+        headers=_headers(author.id),
+    )
+    assert response.status_code == 400
+
+
+def test_create_comment_inserts_missing_post_stats(client, db_session):
+    author = _make_user(db_session, "author")
+    commenter = _make_user(db_session, "commenter")
+    _connect(db_session, author, commenter)
+    post = Post(author_id=author.id, content="post", created_at=datetime(2026, 1, 1))
+    db_session.add(post)
+    db_session.commit()
+    assert db_session.get(PostStats, post.id) is None
+
+    response = client.post(
+        "/comments/", json={"post_id": post.id, "content": "first"}, headers=_headers(commenter.id)
+    )
+
+    assert response.status_code == 201
+    db_session.expire_all()
+    assert db_session.get(PostStats, post.id).comment_count == 1
+    notifications = db_session.query(Notification).all()
+    assert len(notifications) == 1
+    assert (notifications[0].recipient_id, notifications[0].actor_id) == (author.id, commenter.id)
+
+
+def test_create_comment_increments_existing_post_stats(client, db_session):
+    author = _make_user(db_session, "author")
+    commenter = _make_user(db_session, "commenter")
+    _connect(db_session, author, commenter)
+    post = _make_post(db_session, author, [author, author])
+
+    response = client.post(
+        "/comments/", json={"post_id": post.id, "content": "third"}, headers=_headers(commenter.id)
+    )
+
+    assert response.status_code == 201
+    db_session.expire_all()
+    assert db_session.get(PostStats, post.id).comment_count == 3
+    assert db_session.query(Notification).count() == 1
+
+
+def test_author_comment_creates_no_notification(client, db_session):
+    author = _make_user(db_session, "author")
+    post = _make_post(db_session, author)
+
+    response = client.post(
+        "/comments/", json={"post_id": post.id, "content": "mine"}, headers=_headers(author.id)
+    )
+
+    assert response.status_code == 201
+    db_session.expire_all()
+    assert db_session.get(PostStats, post.id).comment_count == 1
+    assert db_session.query(Notification).count() == 0
@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import text
+
+from app.core import deps
+from app.core.security import create_access_token
+from app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    deps._USER_CACHE.clear()
+    deps._USER_CACHE_KEYS.clear()
+    yield
+    deps._USER_CACHE.clear()
+    deps._USER_CACHE_KEYS.clear()
+
+
+def _make_user(db, name):
+    user = User(email=f"{name}@example.com", username=name, google_id=f"g-{name}")
+    db.add(user)
+    db.commit()
+    return user.id
+
+
+def _get_me(client, db_session, headers):
+    # Production sessions are per request; drop this test session's identity map
+    db_session.expunge_all()
+    return client.get("/auth/me", headers=headers)
+
+
+def test_user_cache_off_by_default(client, db_session):
+    user_id = _make_user(db_session, "alice")
+    headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+    assert _get_me(client, db_session, headers).status_code == 200
+    assert deps._USER_CACHE == {}
+
+
+def test_cached_user_sees_external_ban_and_delete(client, db_session, monkeypatch):
+    monkeypatch.setattr(deps, "_USER_CACHE_TTL", 30)
+    user_id = _make_user(db_session, "bob")
+    headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+    assert _get_me(client, db_session, headers).status_code == 200
+    assert user_id in deps._USER_CACHE_KEYS
+    assert _get_me(client, db_session, headers).status_code == 200  # cache hit
+
+    # Another process (the moderation service) bans the user: no flush here
+    db_session.execute(text("UPDATE users SET is_banned = 1 WHERE id = :id"), {"id": user_id})
+    db_session.commit()
+    assert _get_me(client, db_session, headers).status_code == 403
+
+    db_session.execute(text("DELETE FROM users WHERE id = :id"), {"id": user_id})
+    db_session.commit()
+    assert _get_me(client, db_session, headers).status_code == 401
+    assert user_id not in deps._USER_CACHE_KEYS
+    assert deps._USER_CACHE == {}
+
+
+def test_local_user_write_evicts_by_id(client, db_session, monkeypatch):
+    monkeypatch.setattr(deps, "_USER_CACHE_TTL", 30)
+    user_id = _make_user(db_session, "carol")
+    headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+    assert _get_me(client, db_session, headers).status_code == 200
+
+    user = db_session.get(User, user_id)
+    user.bio = "hello"
+    db_session.commit()
+    assert user_id not in deps._USER_CACHE_KEYS
+    assert deps._USER_CACHE == {}
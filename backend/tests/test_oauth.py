@@ -0,0 +1,12 @@
+from fastapi.testclient import TestClient
+
+from app.core import oauth
+from app.main import app
+
+
+def test_google_client_usable_after_lifespan_restart():
+    # Shutdown closes the shared client; the next lifespan must get a fresh one
+    for _ in range(2):
+        with TestClient(app):
+            assert not oauth._get_google_client().is_closed
+        assert oauth._google_client is None
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from app.core.security import create_access_token
+from app.models.post import Post
+from app.models.user import User
+from app.routers import posts as posts_router
+
+
+def test_delete_post_survives_storage_failure(client, db_session, monkeypatch):
+    author = User(email="author@example.com", username="author", google_id="g-author")
+    db_session.add(author)
+    db_session.flush()
+    post = Post(
+        author_id=author.id,
+        content="post",
+        photo_urls=["https://cdn.example.com/a.jpg"],
+        created_at=datetime(2026, 1, 1),
+    )
+    db_session.add(post)
+    db_session.commit()
+    post_id = post.id
+
+    def fail(urls):
+        raise RuntimeError("storage unavailable")
+
+    monkeypatch.setattr(posts_router, "delete_photos_from_s3", fail)
+
+    response = client.delete(
+        f"/posts/{post_id}",
+        headers={"Authorization": f"Bearer {create_access_token(author.id)}"},
+    )
+
+    assert response.status_code == 204
+    db_session.expire_all()
+    assert db_session.get(Post, post_id) is None
@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+from unittest import mock
+
+import boto3
+import pytest
+from botocore.config import Config
+
+from app.core.presign import presign_get_url
+
+ENDPOINT = "https://0123456789abcdef.r2.cloudflarestorage.com"
+BUCKET = "intentional-social"
+ACCESS_KEY = "AKIDEXAMPLE"
+SECRET_KEY = "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY"
+NOW = datetime(2026, 3, 14, 15, 9, 26, tzinfo=timezone.utc)
+
+
+def _botocore_url(key, expires_in, response_cache_control):
+    # Same client settings as app.core.s3.get_s3_client
+    client = boto3.client(
+        "s3",
+        aws_access_key_id=ACCESS_KEY,
+        aws_secret_access_key=SECRET_KEY,
+        endpoint_url=ENDPOINT,
+        region_name="auto",
+        config=Config(signature_version="s3v4"),
+    )
+    params = {"Bucket": BUCKET, "Key": key}
+    if response_cache_control:
+        params["ResponseCacheControl"] = response_cache_control
+    with mock.patch("botocore.auth.datetime") as fake_datetime:
+        fake_datetime.datetime.utcnow.return_value = NOW.replace(tzinfo=None)
+        return client.generate_presigned_url("get_object", Params=params, ExpiresIn=expires_in)
+
+
+@pytest.mark.parametrize("key", [
+    "posts/photos/2026/03/14/01234567-89ab-7cde-8f01-23456789abcd.jpg",
+    "users/avatars/with space+plus.png",
+])
+@pytest.mark.parametrize("response_cache_control", [None, "private, max-age=31536000, immutable"])
+def test_presign_matches_botocore(key, response_cache_control):
+    url = presign_get_url(
+        endpoint_url=ENDPOINT,
+        bucket=BUCKET,
+        key=key,
+        access_key=ACCESS_KEY,
+        secret_key=SECRET_KEY,
+        region="auto",
+        expires_in=43200,
+        response_cache_control=response_cache_control,
+        now=NOW,
+    )
+    assert url == _botocore_url(key, 43200, response_cache_control)
@@ -0,0 +1,43 @@
+import pytest
+from starlette.requests import Request
+
+from app.core.rate_limit import get_client_address, limiter
+from app.core.security import create_access_token
+from app.models.user import User
+
+
+@pytest.fixture
+def fresh_limiter():
+    limiter.reset()
+    yield limiter
+    limiter.reset()
+
+
+def _request(peer, forwarded=None):
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "client": (peer, 12345), "headers": headers})
+
+
+def test_limited_route_returns_429(client, db_session, fresh_limiter):
+    user = User(email="limited@example.com", google_id="g-limited")
+    db_session.add(user)
+    db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(user.id)}"}
+
+    codes = [
+        client.post("/auth/username/select", json={"username": "limited"}, headers=headers).status_code
+        for _ in range(6)
+    ]
+
+    assert 429 not in codes[:5]
+    assert codes[5] == 429
+
+
+def test_client_address_uses_forwarded_ip_from_trusted_proxy():
+    assert get_client_address(_request("127.0.0.1", "203.0.113.7")) == "203.0.113.7"
+    assert get_client_address(_request("172.18.0.1", "198.51.100.2, 203.0.113.7")) == "203.0.113.7"
+
+
+def test_client_address_ignores_forwarded_ip_from_untrusted_peer():
+    assert get_client_address(_request("203.0.113.7", "198.51.100.2")) == "203.0.113.7"
+    assert get_client_address(_request("127.0.0.1")) == "127.0.0.1"
@@ -0,0 +1,71 @@
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from app.core.s3 import validate_image
+
+
+def _image_bytes(image_format, size=(100, 80)):
+    buffer = BytesIO()
+    Image.new("RGB", size, (200, 100, 50)).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+def _as_bytes(data):
+    return data
+
+
+def _as_fileobj(data):
+    return BytesIO(data)
+
+
+@pytest.fixture(params=[_as_bytes, _as_fileobj], ids=["bytes", "fileobj"])
+def wrap(request):
+    return request.param
+
+
+@pytest.mark.parametrize("image_format", ["JPEG", "PNG", "WEBP"])
+def test_allowed_formats_are_accepted(image_format, wrap):
+    data = _image_bytes(image_format)
+    is_valid, error, info = validate_image(wrap(data), max_size_mb=1)
+    assert is_valid, error
+    assert info == {"width": 100, "height": 80, "format": image_format, "size_bytes": len(data)}
+
+
+def test_file_object_is_rewound():
+    fileobj = BytesIO(_image_bytes("PNG"))
+    fileobj.seek(10)
+    assert validate_image(fileobj, max_size_mb=1)[0]
+    assert fileobj.tell() == 0
+
+
+@pytest.mark.parametrize("data", [
+    _image_bytes("GIF"),
+    b"just some text, definitely not an image",
+], ids=["gif", "text"])
+def test_disallowed_content_is_rejected(data, wrap):
+    is_valid, error, info = validate_image(wrap(data), max_size_mb=1)
+    assert not is_valid
+    assert error.startswith("Image format not allowed")
+    assert info is None
+
+
+@pytest.mark.parametrize("data", [
+    _image_bytes("JPEG")[:20],
+    _image_bytes("PNG")[:20],
+    # PNG signature in front of JPEG data
+    b"\x89PNG\r\n\x1a\n" + _image_bytes("JPEG"),
+], ids=["truncated-jpeg", "truncated-png", "png-magic-jpeg-body"])
+def test_corrupt_images_are_rejected_without_internal_details(data, wrap):
+    is_valid, error, info = validate_image(wrap(data), max_size_mb=1)
+    assert not is_valid
+    assert error.startswith("Invalid or corrupt")
+    assert "BytesIO" not in error and "0x" not in error
+    assert info is None
+
+
+def test_oversized_file_is_rejected(wrap):
+    is_valid, error, _ = validate_image(wrap(_image_bytes("PNG")), max_size_mb=0.0001)
+    assert not is_valid
+    assert "exceeds maximum allowed size" in error
@@ -0,0 +1,62 @@
+from app.core.security import create_access_token
+from app.models.user import User
+
+
+def _make_user(db, name, email=None):
+    user = User(email=email or f"{name}@example.com", username=name, google_id=f"g-{name}")
+    db.add(user)
+    db.flush()
+    return user
+
+
+def _headers(user_id):
+    return {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+
+def test_search_matches_email_case_insensitively(client, db_session):
+    viewer = _make_user(db_session, "viewer")
+    target = _make_user(db_session, "target", email="Target.Person@Example.com")
+    db_session.commit()
+
+    for q in ("target.person@example.com", "TARGET.PERSON@EXAMPLE.COM", "Target.Person@Example.com"):
+        response = client.get("/auth/users/search", params={"q": q}, headers=_headers(viewer.id))
+        assert response.status_code == 200
+        assert [u["id"] for u in response.json()] == [target.id]
+
+
+def test_search_matches_username_and_excludes_self(client, db_session):
+    viewer = _make_user(db_session, "viewer")
+    target = _make_user(db_session, "target")
+    db_session.commit()
+
+    response = client.get("/auth/users/search", params={"q": "Target"}, headers=_headers(viewer.id))
+    assert [u["id"] for u in response.json()] == [target.id]
+
+    response = client.get("/auth/users/search", params={"q": "viewer"}, headers=_headers(viewer.id))
+    assert response.json() == []
+
+
+def test_get_users_pages_by_after_id(client, db_session):
+    ids = [_make_user(db_session, f"user{i}").id for i in range(5)]
+    db_session.commit()
+
+    first = client.get("/auth/users", params={"limit": 2}).json()
+    assert [u["id"] for u in first] == ids[:2]
+
+    second = client.get("/auth/users", params={"limit": 2, "after_id": first[-1]["id"]}).json()
+    assert [u["id"] for u in second] == ids[2:4]
+
+    last = client.get("/auth/users", params={"limit": 2, "after_id": ids[-1]}).json()
+    assert last == []
+
+
+def test_get_users_after_id_matches_offset_paging(client, db_session):
+    for i in range(5):
+        _make_user(db_session, f"user{i}")
+    db_session.commit()
+
+    by_offset = client.get("/auth/users", params={"skip": 3, "limit": 2}).json()
+    anchor = client.get("/auth/users", params={"limit": 3}).json()[-1]["id"]
+    by_keyset = client.get("/auth/users", params={"after_id": anchor, "limit": 2}).json()
+
+    assert by_keyset == by_offset
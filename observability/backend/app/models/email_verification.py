@@ -11,7 +11,7 @@ class EmailVerification(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)  # Nullable for registration OTPs
     email = Column(String(255), nullable=False)
-    otp_code = Column(String(6), nullable=False)  # 6-digit OTP
+    otp_code = Column(Integer, nullable=False)  # 6-digit OTP, zero-padded only for display
     expires_at = Column(DateTime, nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     verified_at = Column(DateTime, nullable=True)
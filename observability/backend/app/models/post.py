@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 
 from app.db import Base
@@ -12,7 +13,8 @@ class Post(Base):
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
     audience_type = Column(String(20), default="all")  # 'all', 'tags', 'connections', 'private'
-    photo_urls = Column(JSON, default=lambda: [])  # List of S3 keys for photos
+    # List of S3 keys for photos; text[] on PostgreSQL, same mapping as the main backend
+    photo_urls = Column(JSON().with_variant(ARRAY(Text), "postgresql"), default=lambda: [], nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
 
     author = relationship("User", back_populates="posts")